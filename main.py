@@ -8,26 +8,31 @@ Returns:
     FastAPI: Configured FastAPI application instance
 """
 
+import asyncio
+import inspect
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from rag_support_client.api.routers import admin, chat
 from rag_support_client.config.config import get_settings
-from rag_support_client.rag.document_loader import DocumentLoader
-from rag_support_client.rag.llm.ollama import create_chain
-from rag_support_client.rag.vectorstore.base import VectorStoreManager
 from rag_support_client.utils.logger import logger
 from rag_support_client.utils.state import app_state
 
 settings = get_settings()
 
+_ALLOWED_HOSTS = tuple(settings.allowed_hosts)
+_ALLOWED_ORIGINS = tuple(settings.cors_origins)
+_ALLOWED_METHODS = ("GET", "POST", "DELETE")
+
 
 async def custom_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
@@ -97,20 +102,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Raises:
         RuntimeError: If critical components fail to initialize
     """
+    # Heavy RAG imports (langchain, Ollama, Chroma) are deferred until startup
+    from langchain.schema import Document
+
+    from rag_support_client.rag.document_loader import (
+        corpus_fingerprint,
+        get_document_loader,
+    )
+    from rag_support_client.rag.llm.ollama import create_chain, warmup_llm
+    from rag_support_client.rag.vectorstore.base import VectorStoreManager
+
     try:
         logger.info("Application startup - Initializing RAG components")
 
-        # Load documents
-        logger.info("Loading documents...")
-        loader = DocumentLoader()
-        documents = loader.load_documents()
-        if not documents:
-            raise RuntimeError("No documents loaded")
-        logger.info(f"Loaded {len(documents)} document chunks")
-
-        # Initialize vector store
+        def load_documents() -> list[Document]:
+            """Load documents, only called when the index must be (re)built."""
+            logger.info("Loading documents...")
+            documents = get_document_loader().load_documents()
+            if not documents:
+                raise RuntimeError("No documents loaded")
+            logger.info(f"Loaded {len(documents)} document chunks")
+            return documents
+
+        def open_vectorstore() -> Any:
+            """Open the persisted index, rebuilding it if the corpus changed."""
+            return VectorStoreManager.load_or_create(
+                load_documents,
+                rebuild=settings.REBUILD_INDEX,
+                fingerprint=corpus_fingerprint(Path(settings.MARKDOWN_DIR)),
+            )
+
+        # Initialize vector store, reusing the persisted index when available,
+        # while Ollama loads the LLM model in parallel
         logger.info("Initializing vector store...")
-        vectorstore = VectorStoreManager.create_vectorstore(documents)
+        vectorstore, _ = await asyncio.gather(
+            asyncio.to_thread(open_vectorstore),
+            warmup_llm(),
+        )
         if not vectorstore:
             raise RuntimeError("Vector store initialization failed")
         app_state.vectorstore = vectorstore
@@ -122,6 +150,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             raise RuntimeError("RAG chain initialization failed")
         app_state.rag_chain = chain
 
+        # Run one query end to end so the first user request hits a warm
+        # retriever and LLM. No session id is passed, so no history is stored.
+        try:
+            logger.info("Warming up RAG chain...")
+            await chain.ainvoke({"question": "warmup"})
+        except Exception as e:
+            logger.warning(f"RAG chain warmup skipped: {str(e)}")
+
         yield
     except Exception as e:
         logger.error(f"Startup failed: {str(e)}", exc_info=True)
@@ -129,13 +165,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     finally:
         # Cleanup
         logger.info("Shutting down application...")
-        if app_state.vectorstore is not None:
+        vectorstore = app_state.vectorstore
+        if vectorstore is not None:
             try:
-                # Try different cleanup methods
-                for method in ["aclose", "close", "_client.close"]:
-                    if hasattr(app_state.vectorstore, method):
-                        await getattr(app_state.vectorstore, method)()
-                        break
+                # Use the first available cleanup method, sync or async
+                for closer in (
+                    getattr(vectorstore, "aclose", None),
+                    getattr(vectorstore, "close", None),
+                    getattr(getattr(vectorstore, "_client", None), "close", None),
+                ):
+                    if closer is None:
+                        continue
+                    result = closer()
+                    if inspect.isawaitable(result):
+                        await result
+                    break
             except Exception as e:
                 logger.warning(f"Error during vectorstore cleanup: {e}")
 
@@ -145,23 +189,12 @@ def create_app() -> FastAPI:
     Initialize and configure the FastAPI application.
     """
 
-    def custom_openapi() -> dict[str, Any]:
-        """Generate custom OpenAPI schema."""
-        if app.openapi_schema:
-            return app.openapi_schema
-        return get_custom_openapi(app)
-
-    class CustomFastAPI(FastAPI):
-        """Custom FastAPI class with overridden openapi method."""
-
-        def openapi(self) -> dict[str, Any]:
-            return custom_openapi()
-
-    app = CustomFastAPI(
+    app = FastAPI(
         title=settings.APP_NAME,
         description="API for RAG-based customer support system",
         version=settings.APP_VERSION,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         swagger_ui_parameters={
             "persistAuthorization": True,
             "displayRequestDuration": True,
@@ -177,33 +210,50 @@ def create_app() -> FastAPI:
     # Exception handler
     app.add_exception_handler(Exception, custom_exception_handler)
 
-    # Security middleware
-    allowed_hosts = ["localhost", "127.0.0.1"]
-    app.add_middleware(TrustedHostMiddleware, allowed_hosts=allowed_hosts)
+    # Security middleware, skipped in development or when any host is allowed
+    if not settings.DEBUG and "*" not in _ALLOWED_HOSTS:
+        app.add_middleware(TrustedHostMiddleware, allowed_hosts=_ALLOWED_HOSTS)
 
     # CORS middleware
-    allowed_origins = ["http://localhost:3000", "http://localhost:8501"]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=allowed_origins,
+        allow_origins=_ALLOWED_ORIGINS,
         allow_credentials=True,
-        allow_methods=["GET", "POST", "DELETE"],
+        allow_methods=_ALLOWED_METHODS,
         allow_headers=["*"],
         max_age=86400,
     )
 
+    @lru_cache(maxsize=1)
+    def custom_openapi() -> dict[str, Any]:
+        """Generate custom OpenAPI schema once and serve the cached dict."""
+        return get_custom_openapi(app)
+
+    app.openapi = custom_openapi  # type: ignore[method-assign]
+
+    # Build the schema eagerly so the first /docs hit does not pay for it
+    custom_openapi()
+
     return app
 
 
 app = create_app()
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
+    # Reload mode only supports a single worker
+    workers = (
+        1 if settings.DEBUG else settings.WORKERS or (os.cpu_count() or 1) * 2 + 1
+    )
+
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
+        workers=workers,
         reload=settings.DEBUG,
         log_level="debug" if settings.DEBUG else "info",
         access_log=settings.DEBUG,
@@ -2,6 +2,8 @@
 FastAPI dependencies and shared utilities.
 """
 
+import hmac
+
 from fastapi import Header, HTTPException, status
 from langchain.chains import ConversationalRetrievalChain
 
@@ -11,16 +13,19 @@ from rag_support_client.utils.state import app_state
 
 settings = get_settings()
 
+_API_KEY_BYTES = settings.API_KEY.encode()
+
 
 async def get_api_key(
     x_api_key: str = Header(None, alias=settings.API_KEY_NAME)
 ) -> str:
-    logger.warning(f"API Key received: {x_api_key}")
     if not x_api_key:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="API key is required"
         )
-    if x_api_key != settings.API_KEY:
+    # Constant-time comparison to avoid leaking the key through timing
+    if not hmac.compare_digest(x_api_key.encode(), _API_KEY_BYTES):
+        logger.debug("Rejected request with invalid API key")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key"
         )
@@ -9,7 +9,10 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from rag_support_client.config.config import settings
+from rag_support_client.config.config import get_settings
+
+# Field bounds below are fixed at import time from the cached settings
+settings = get_settings()
 
 
 class ChatRequest(BaseModel):
@@ -24,6 +27,26 @@ class ChatRequest(BaseModel):
         description="User question",
         examples=["Comment configurer mon terminal de paiement ?"],
     )
+    include_confidence: bool = Field(
+        default=True,
+        description="Compute confidence scores (disable for lower latency)",
+    )
+
+
+class ConfidenceDetails(BaseModel):
+    """Breakdown of the individual confidence sub-scores."""
+
+    model_config = ConfigDict(frozen=True)
+
+    similarity: float = Field(..., ge=0.0, le=1.0)
+    relevance: float = Field(..., ge=0.0, le=1.0)
+    coverage: float = Field(..., ge=0.0, le=1.0)
+    coherence: float = Field(..., ge=0.0, le=1.0)
+    consistency: float = Field(..., ge=0.0, le=1.0)
+    completeness: float = Field(..., ge=0.0, le=1.0)
+    contradictions: list[str] = Field(
+        default_factory=list, description="Detected potential contradictions"
+    )
 
 
 class ConfidenceScore(BaseModel):
@@ -32,9 +55,37 @@ class ConfidenceScore(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     score: float = Field(..., ge=0.0, le=1.0, description="Overall confidence score")
-    level: Literal["high", "medium", "low"] = Field(
+    level: Literal["excellent", "acceptable", "needs_improvement", "error"] = Field(
         ..., description="Qualitative confidence level"
     )
+    details: ConfidenceDetails | None = Field(
+        default=None, description="Individual sub-scores"
+    )
+
+
+class AnswerContent(BaseModel):
+    """Generated answer with its display metadata."""
+
+    model_config = ConfigDict(frozen=True)
+
+    title: str = Field(..., description="Title of the most relevant document")
+    content: str = Field(..., description="Generated response")
+    format: Literal["markdown"] = Field(
+        default="markdown", description="Format of the content"
+    )
+
+
+class ResponseMetadata(BaseModel):
+    """Request context echoed back with the response."""
+
+    model_config = ConfigDict(frozen=True)
+
+    session_id: str = Field(..., description="Chat session identifier")
+    question: str = Field(..., description="Original user question")
+    timestamp: str = Field(..., description="UTC response time (ISO 8601)")
+    context_length: int = Field(
+        ..., ge=0, description="Number of messages in the session history"
+    )
 
 
 class ChatResponse(BaseModel):
@@ -42,16 +93,16 @@ class ChatResponse(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
-    answer: str = Field(
-        ...,
-        description="Generated response",
-    )
+    answer: AnswerContent = Field(..., description="Generated response")
     sources: list[str] = Field(
         default_factory=list,
         max_length=settings.API_MAX_SOURCES,
         description="Source documentation URLs",
     )
-    confidence: ConfidenceScore = Field(..., description="Confidence scoring")
+    confidence: ConfidenceScore | None = Field(
+        default=None, description="Confidence scoring"
+    )
+    metadata: ResponseMetadata = Field(..., description="Request metadata")
 
 
 class HealthResponse(BaseModel):
@@ -66,3 +117,16 @@ class HealthResponse(BaseModel):
     version: str = Field(
         ..., pattern=r"^\d+\.\d+\.\d+$", description="Semantic version"
     )
+
+
+# Build validators at import time so the first request does not pay for it
+for _model in (
+    ChatRequest,
+    ConfidenceDetails,
+    ConfidenceScore,
+    AnswerContent,
+    ResponseMetadata,
+    ChatResponse,
+    HealthResponse,
+):
+    _model.model_rebuild(force=True)
@@ -11,7 +11,9 @@ from ..models.schemas import HealthResponse
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-@router.get("/health", response_model=HealthResponse)
+@router.get(
+    "/health", response_model=HealthResponse, response_model_exclude_unset=True
+)
 async def health_check() -> HealthResponse:
     """
     Check the health status of the API and its components.
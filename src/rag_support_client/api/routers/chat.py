@@ -4,40 +4,59 @@ Provides secure conversation endpoints with session management and RAG chain
 interactions.
 """
 
-from datetime import UTC, datetime
-from typing import Annotated
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
 
+import orjson
 from fastapi import APIRouter, HTTPException, Response, Security
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from langchain.schema import Document
 
 from rag_support_client.api.dependencies import get_api_key
-from rag_support_client.api.models.schemas import ChatRequest
-from rag_support_client.rag.scoring import calculate_confidence
+from rag_support_client.api.models.schemas import (
+    AnswerContent,
+    ChatRequest,
+    ChatResponse,
+    ConfidenceDetails,
+    ConfidenceScore,
+    ResponseMetadata,
+)
+from rag_support_client.config.config import get_settings
+from rag_support_client.rag.scoring import ConfidenceResult, calculate_confidence
 from rag_support_client.utils.logger import logger
 from rag_support_client.utils.state import app_state
 
+settings = get_settings()
+
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with microseconds"""
+    now = time.time()
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+        + f".{int(now % 1 * 1_000_000):06d}+00:00"
+    )
+
+
 def build_contextual_query(session_id: str, current_question: str) -> str:
     """Build a query that includes relevant conversation history"""
-    history = app_state.conversation_manager.get_history(session_id)
+    # Get last 6 exchanges (12 messages = 6 pairs of Q&A)
+    recent_history = app_state.conversation_manager.get_recent(session_id, 12)
 
-    if not history:
+    if not recent_history:
         return current_question
 
-    # Get last 6 exchanges (12 messages = 6 pairs of Q&A)
-    recent_history = history[-12:]
-
     # Build context string
-    context_parts = []
-
-    for msg in recent_history:
-        role = "Question" if msg["role"] == "human" else "Réponse"
-        context_parts.append(f"{role}: {msg['content']}")
+    context = "\n".join(
+        f"{'Question' if msg['role'] == 'human' else 'Réponse'}: {msg['content']}"
+        for msg in recent_history
+    )
 
     # Add current question with explicit instruction
-    context = "\n".join(context_parts)
     query = (
         "En tenant compte de cet historique de conversation:\n"
         f"{context}\n\n"
@@ -45,7 +64,7 @@ def build_contextual_query(session_id: str, current_question: str) -> str:
         "Réponds en restant dans le contexte de la conversation."
     )
 
-    logger.debug(f"Built contextual query: {query}")
+    logger.debug("Built contextual query: %s", query)
     return query
 
 
@@ -59,16 +78,105 @@ async def create_session(
     return {"session_id": session_id}
 
 
-@router.post("/{session_id}")
+def _start_scoring(
+    request: ChatRequest, answer: str, documents: list[Document]
+) -> asyncio.Task[ConfidenceResult] | None:
+    """Start confidence scoring in a worker thread unless the client opted out"""
+    if not request.include_confidence:
+        return None
+    return asyncio.create_task(
+        asyncio.to_thread(
+            calculate_confidence,
+            question=request.question,
+            answer=answer,
+            documents=documents,
+        )
+    )
+
+
+def _store_interaction(session_id: str, question: str, answer: str) -> None:
+    """Store the question/answer pair in conversation history"""
+    app_state.conversation_manager.add_message(
+        session_id=session_id, role="human", content=question
+    )
+    app_state.conversation_manager.add_message(
+        session_id=session_id, role="assistant", content=answer
+    )
+
+
+async def _build_response(
+    session_id: str,
+    request: ChatRequest,
+    answer: str,
+    documents: list[Document],
+    score_task: asyncio.Task[ConfidenceResult] | None,
+) -> ChatResponse:
+    """Assemble the chat response while confidence scoring runs"""
+    # Extract unique source URLs, preserving retrieval order
+    sources = list(
+        dict.fromkeys(
+            doc.metadata["source_url"]
+            for doc in documents
+            if doc.metadata.get("source_url")
+        )
+    )
+
+    # Get the title from the most relevant document
+    title = "Information not found"
+    if documents:
+        title = documents[0].metadata.get("h1", "Information not found")
+
+    # Confidence is left unset when skipped so it is excluded from the output
+    optional_fields: dict[str, ConfidenceScore] = {}
+    if score_task is not None:
+        scores = await score_task
+        optional_fields["confidence"] = ConfidenceScore(
+            score=scores["total"],
+            level=scores["quality"],
+            details=ConfidenceDetails(
+                similarity=scores["similarity"],
+                relevance=scores["relevance"],
+                coverage=scores["coverage"],
+                coherence=scores["coherence"],
+                consistency=scores["consistency"],
+                completeness=scores["completeness"],
+                contradictions=scores["contradictions"],
+            ),
+        )
+
+    return ChatResponse(
+        answer=AnswerContent(title=title, content=answer, format="markdown"),
+        sources=sources[: settings.API_MAX_SOURCES],
+        metadata=ResponseMetadata(
+            session_id=session_id,
+            question=request.question,
+            timestamp=_utc_timestamp(),
+            context_length=app_state.conversation_manager.history_length(
+                session_id
+            ),
+        ),
+        **optional_fields,
+    )
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> bytes:
+    """Encode a Server-Sent Event with a JSON payload"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.post(
+    "/{session_id}", response_model=ChatResponse, response_model_exclude_unset=True
+)
 async def chat(
     session_id: str,
     request: ChatRequest,
+    response: Response,
     api_key: Annotated[str, Security(get_api_key)],
-) -> Response:
+) -> ChatResponse:
     """Process chat request for given session"""
     try:
         logger.debug(
-            f"Processing question for session {session_id}: {request.question}"
+            "Processing question for session %s: %s", session_id, request.question
         )
 
         if not app_state.rag_chain:
@@ -77,75 +185,20 @@ async def chat(
         # Build contextual query
         contextual_query = build_contextual_query(session_id, request.question)
 
-        # Process query through RAG chain
-        result = app_state.rag_chain.invoke(
+        # Process query through RAG chain without blocking the event loop
+        result = await app_state.rag_chain.ainvoke(
             {"question": contextual_query, "session_id": session_id}
         )
+        answer = result["result"]["response"]
+        documents = result["result"]["source_documents"]
 
-        # Store the interaction in conversation history
-        app_state.conversation_manager.add_message(
-            session_id=session_id, role="human", content=request.question
-        )
-        app_state.conversation_manager.add_message(
-            session_id=session_id,
-            role="assistant",
-            content=result["result"]["response"],
-        )
-
-        # Extract source URLs
-        sources = [
-            doc.metadata.get("source_url", "")
-            for doc in result["result"]["source_documents"]
-            if doc.metadata.get("source_url")
-        ]
+        # Score while the interaction is stored and the response assembled
+        score_task = _start_scoring(request, answer, documents)
+        _store_interaction(session_id, request.question, answer)
 
-        # Get the title from the most relevant document
-        title = "Information not found"
-        if result["result"]["source_documents"]:
-            title = result["result"]["source_documents"][0].metadata.get(
-                "h1", "Information not found"
-            )
-
-        # Calculate confidence scores using existing scoring module
-        scores = calculate_confidence(
-            question=request.question,
-            answer=result["result"]["response"],
-            documents=result["result"]["source_documents"],
-        )
-
-        # Structure the response
-        response_data = {
-            "answer": {
-                "title": title,
-                "content": result["result"]["response"],
-                "format": "markdown",
-            },
-            "sources": list(set(sources)),
-            "confidence": {
-                "score": scores["total"],
-                "level": scores["quality"],
-                "details": {
-                    "similarity": scores["similarity"],
-                    "relevance": scores["relevance"],
-                    "coverage": scores["coverage"],
-                    "coherence": scores["coherence"],
-                    "consistency": scores["consistency"],
-                    "completeness": scores["completeness"],
-                    "contradictions": scores["contradictions"],
-                },
-            },
-            "metadata": {
-                "session_id": session_id,
-                "question": request.question,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "context_length": len(
-                    app_state.conversation_manager.get_history(session_id)
-                ),
-            },
-        }
-
-        return JSONResponse(
-            content=response_data, headers={"X-Content-Type-Options": "nosniff"}
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        return await _build_response(
+            session_id, request, answer, documents, score_task
         )
 
     except Exception as err:
@@ -155,6 +208,63 @@ async def chat(
         ) from err
 
 
+@router.post("/{session_id}/stream")
+async def chat_stream(
+    session_id: str,
+    request: ChatRequest,
+    api_key: Annotated[str, Security(get_api_key)],
+) -> StreamingResponse:
+    """
+    Process chat request for given session, streaming the answer as
+    Server-Sent Events.
+
+    Emits one ``token`` event per generated token, then a single ``done`` event
+    carrying the same payload as the non-streaming endpoint, or an ``error``
+    event if generation fails midway.
+    """
+    chain = app_state.rag_chain
+    if not chain:
+        raise HTTPException(
+            status_code=503, detail="Service not ready - RAG chain not initialized"
+        )
+
+    contextual_query = build_contextual_query(session_id, request.question)
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        tokens: list[str] = []
+        documents: list[Document] = []
+        try:
+            async for chunk in chain.astream(
+                {"question": contextual_query, "session_id": session_id}
+            ):
+                result = chunk.get("result", {})
+                documents = result.get("source_documents", documents)
+                if token := result.get("response"):
+                    tokens.append(token)
+                    yield _sse_event("token", {"token": token})
+
+            answer = "".join(tokens)
+            score_task = _start_scoring(request, answer, documents)
+            _store_interaction(session_id, request.question, answer)
+
+            chat_response = await _build_response(
+                session_id, request, answer, documents, score_task
+            )
+            yield _sse_event("done", chat_response.model_dump(exclude_unset=True))
+
+        except Exception as err:
+            logger.error(f"Error streaming answer: {str(err)}", exc_info=True)
+            yield _sse_event(
+                "error", {"detail": f"Error processing your request: {str(err)}"}
+            )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Content-Type-Options": "nosniff"},
+    )
+
+
 @router.delete("/{session_id}")
 async def end_session(
     session_id: str,
@@ -4,12 +4,14 @@ Configuration management module using Pydantic.
 """
 import json
 import logging
+import re
 from enum import Enum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     ValidationError,
     ValidationInfo,
@@ -60,9 +62,66 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# Escaped newline and quotes in comma-separated separator values
+_SEPARATOR_ESCAPES = {"n": "\n", "'": "'", '"': '"'}
+_SEPARATOR_ESCAPE_PATTERN = re.compile(r"\\([n'\"])")
+
+
+def _unescape_separator(value: str) -> str:
+    """Replace escaped separator characters in a single pass."""
+    return _SEPARATOR_ESCAPE_PATTERN.sub(
+        lambda match: _SEPARATOR_ESCAPES[match.group(1)], value
+    )
+
+
+@lru_cache(maxsize=8)
+def _parse_separators(raw: str) -> tuple[str, ...]:
+    """
+    Parse a SEPARATORS setting value, cached per raw string.
+
+    Args:
+        raw: JSON array or comma-separated list of separators
+
+    Returns:
+        tuple[str, ...]: Parsed separators, defaults if parsing fails
+    """
+    default_separators = ("\n\n", "\n", ".", " ", "")
+    try:
+        if not raw:
+            return default_separators
+
+        # Attempt JSON parsing with quote normalization
+        try:
+            parsed = json.loads(raw.replace("'", '"'))
+            if isinstance(parsed, list):
+                return tuple(parsed)
+        except json.JSONDecodeError:
+            pass
+
+        # Fallback to comma-separated string parsing
+        seps = tuple(
+            _unescape_separator(s.strip())
+            for s in raw.strip("[]").split(",")
+            if s.strip()
+        )
+        return seps if seps else default_separators
+
+    except Exception as e:
+        logging.warning(f"Failed to parse SEPARATORS: {e}, using defaults")
+        return default_separators
+
+
+@lru_cache(maxsize=8)
+def _parse_stop_sequences(raw: str) -> tuple[str, ...]:
+    """Parse a comma-separated LLM_STOP_SEQUENCES value, cached per raw string."""
+    return tuple(seq.strip() for seq in raw.split(",") if seq.strip())
+
+
 class ConversationSettings(BaseModel):
     """Settings for conversation management."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     max_history: int = Field(
         default=10,
         ge=1,
@@ -80,6 +139,8 @@ class ConversationSettings(BaseModel):
 class MarkdownSettings(BaseModel):
     """Settings for Markdown processing."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     headers_to_split_on: list[tuple[str, str]] = Field(
         default=[
             ("#", "h1"),
@@ -99,6 +160,8 @@ class MarkdownSettings(BaseModel):
 class TextSplitterSettings(BaseModel):
     """Settings for text splitting configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     chunk_size: int = Field(default=1000, ge=100, le=8192)
     chunk_overlap: int = Field(default=200, ge=0)
     separators: list[str] = Field(default=["\n\n", "\n", " ", ""])
@@ -115,6 +178,13 @@ class TextSplitterSettings(BaseModel):
         return value
 
 
+@lru_cache(maxsize=8)
+def _ensure_directories(dirs: frozenset[Path]) -> None:
+    """Create each distinct directory once per process and set of paths."""
+    for directory in dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+
+
 class Settings(BaseSettings):
     """Application settings with enhanced validation."""
 
@@ -127,6 +197,11 @@ class Settings(BaseSettings):
     # API Server Configuration
     HOST: str = Field(default="localhost")
     PORT: int = Field(default=8000, ge=1024, le=65535)
+    WORKERS: int = Field(
+        default=1,
+        ge=0,
+        description="Number of uvicorn workers, 0 means 2 * CPU cores + 1",
+    )
     API_V1_PREFIX: str = Field(default="/api/v1")
     API_MAX_QUESTION_LENGTH: int = 1000
     API_MIN_QUESTION_LENGTH: int = 3
@@ -134,6 +209,15 @@ class Settings(BaseSettings):
     API_MAX_SOURCES: int = 10
     API_MAX_CONTRADICTIONS: int = 5
 
+    ALLOWED_HOSTS: str = Field(
+        default="localhost,127.0.0.1",
+        description="Comma-separated list of allowed hosts, '*' allows any host",
+    )
+    CORS_ORIGINS: str = Field(
+        default="http://localhost:3000,http://localhost:8501",
+        description="Comma-separated list of allowed CORS origins",
+    )
+
     # API Security Settings
     API_KEY_NAME: str = Field(
         default="X-API-Key",
@@ -153,6 +237,20 @@ class Settings(BaseSettings):
     OLLAMA_TIMEOUT: int = Field(default=120, ge=1, le=600)
     LLM_MODEL: str = Field(default="llama3.1:latest")
     EMBEDDING_MODEL: str = Field(default="nomic-embed-text")
+    EMBEDDING_CACHE_SIZE: int = Field(
+        default=4096,
+        ge=0,
+        description="Number of embedding vectors kept in memory, 0 disables it",
+    )
+    EMBEDDING_BATCH_SIZE: int = Field(
+        default=64, ge=1, description="Maximum number of texts per embed request"
+    )
+    EMBEDDING_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum number of concurrent embed requests to Ollama",
+    )
     LLM_TEMPERATURE: float = Field(default=0.0, ge=0.0, le=1.0)
 
     # Directory Settings
@@ -175,6 +273,11 @@ class Settings(BaseSettings):
     CHROMA_COLLECTION_NAME: str = Field(default="support_docs")
     CHROMA_ALLOW_RESET: bool = Field(default=True)
     EMBEDDING_DISTANCE_METRIC: DistanceMetric = Field(default=DistanceMetric.COSINE)
+    REBUILD_INDEX: bool = Field(
+        default=False,
+        description="Re-embed all documents at startup instead of reusing the "
+        "persisted collection",
+    )
 
     # RAG Settings
     SIMILARITY_TOP_K: int = Field(default=3, ge=1, le=20)
@@ -275,9 +378,9 @@ class Settings(BaseSettings):
                 raise ValueError("API_KEY must be at least 32 characters in production")
         return self
 
-    @property
+    @cached_property
     def text_splitter_settings(self) -> TextSplitterSettings:
-        """Get text splitter settings as a validated object."""
+        """Get text splitter settings as a validated object, built once."""
         return TextSplitterSettings(
             chunk_size=self.CHUNK_SIZE,
             chunk_overlap=self.CHUNK_OVERLAP,
@@ -295,42 +398,11 @@ class Settings(BaseSettings):
         Returns:
             list[str]: List of separator strings for text splitting
         """
-        import logging
+        # Handle native list type
+        if isinstance(self.SEPARATORS, list):
+            return self.SEPARATORS
 
-        default_separators = ["\n\n", "\n", ".", " ", ""]
-        try:
-            if not self.SEPARATORS:
-                return default_separators
-
-            # Handle native list type
-            if isinstance(self.SEPARATORS, list):
-                return self.SEPARATORS
-
-            # Attempt JSON parsing with quote normalization
-            try:
-                parsed = json.loads(self.SEPARATORS.replace("'", '"'))
-                if isinstance(parsed, list):
-                    return parsed
-            except json.JSONDecodeError:
-                pass
-
-            # Fallback to comma-separated string parsing
-            if isinstance(self.SEPARATORS, str):
-                seps = [
-                    s.strip()
-                    .replace("\\n", "\n")
-                    .replace("\\'", "'")
-                    .replace('\\"', '"')
-                    for s in self.SEPARATORS.strip("[]").split(",")
-                    if s.strip()
-                ]
-                return seps if seps else default_separators
-
-            return default_separators
-
-        except Exception as e:
-            logging.warning(f"Failed to parse SEPARATORS: {e}, using defaults")
-            return default_separators
+        return list(_parse_separators(self.SEPARATORS))
 
     @property
     def separators(self) -> list[str]:
@@ -344,12 +416,24 @@ class Settings(BaseSettings):
             return ["\nHuman:", "\nAssistant:"]
 
         if isinstance(self.LLM_STOP_SEQUENCES, str):
-            return [
-                seq.strip() for seq in self.LLM_STOP_SEQUENCES.split(",") if seq.strip()
-            ]
+            return list(_parse_stop_sequences(self.LLM_STOP_SEQUENCES))
 
         return list(self.LLM_STOP_SEQUENCES)
 
+    @property
+    def allowed_hosts(self) -> list[str]:
+        """Parse and return allowed hosts as a list."""
+        return [
+            host.strip() for host in self.ALLOWED_HOSTS.split(",") if host.strip()
+        ]
+
+    @property
+    def cors_origins(self) -> list[str]:
+        """Parse and return allowed CORS origins as a list."""
+        return [
+            origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()
+        ]
+
     @property
     def templates(self) -> dict[str, str]:
         """Return a dictionary of all templates for easy access."""
@@ -392,17 +476,18 @@ class Settings(BaseSettings):
     @model_validator(mode="after")
     def create_directories(self) -> "Settings":
         """Ensure all required directories exist."""
-        dirs = [
-            self.DATA_DIR,
-            self.RAW_DIR,
-            self.PROCESSED_DIR,
-            self.MARKDOWN_DIR,
-            self.CHROMA_PERSIST_DIRECTORY,
-            self.LOG_FILE.parent,
-        ]
-
-        for directory in dirs:
-            directory.mkdir(parents=True, exist_ok=True)
+        _ensure_directories(
+            frozenset(
+                {
+                    self.DATA_DIR,
+                    self.RAW_DIR,
+                    self.PROCESSED_DIR,
+                    self.MARKDOWN_DIR,
+                    self.CHROMA_PERSIST_DIRECTORY,
+                    self.LOG_FILE.parent,
+                }
+            )
+        )
 
         return self
 
@@ -416,13 +501,17 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Create and cache settings instance."""
     try:
         settings = Settings()
-        if settings.DEBUG:
-            logging.debug(f"Settings loaded successfully: {settings.model_dump()}")
+        # Only serialize settings when the debug record will actually be emitted
+        if settings.DEBUG and logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Settings loaded successfully: %s",
+                settings.model_dump(exclude={"API_KEY"}),
+            )
         return settings
     except ValidationError as e:
         logging.error(f"Settings validation error: {e}")
@@ -2,9 +2,39 @@
 """
 RAG module initialization.
 Provides access to main RAG components.
+
+Components are imported on first access, so importing a submodule does not
+load langchain, Ollama and Chroma integrations it does not need.
 """
-from .embeddings.ollama import get_embeddings
-from .llm.ollama import create_chain
-from .vectorstore.base import VectorStoreManager
 
-__all__ = ["VectorStoreManager", "get_embeddings", "create_chain"]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .document_loader import get_document_loader
+    from .embeddings.ollama import get_embeddings
+    from .llm.ollama import create_chain
+    from .vectorstore.base import VectorStoreManager
+
+_LAZY_IMPORTS = {
+    "VectorStoreManager": ".vectorstore.base",
+    "get_document_loader": ".document_loader",
+    "get_embeddings": ".embeddings.ollama",
+    "create_chain": ".llm.ollama",
+}
+
+__all__ = [
+    "VectorStoreManager",
+    "get_document_loader",
+    "get_embeddings",
+    "create_chain",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported components on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,12 @@ Document loader module for the RAG Support application.
 Handles loading and preprocessing of Markdown documents.
 """
 
+import hashlib
+import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from langchain.schema import Document
@@ -14,6 +20,124 @@ from langchain_text_splitters import (
 from rag_support_client.config.config import get_settings
 from rag_support_client.utils.logger import logger
 
+# Source link expected on the last non-blank line, e.g. "<https://...>"
+_SOURCE_URL_PATTERN = re.compile(r"<\s*(https?://[^>]*?)\s*>?")
+
+# Section fields every chunk carries, even when the splitter did not set them
+_CHUNK_META_DEFAULTS = {"section": "", "subsection": ""}
+
+
+def iter_markdown_entries(directory: Path) -> Iterator[os.DirEntry[str]]:
+    """
+    Recursively yield the directory entries of Markdown files.
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    read, instead of Path.glob("**/*.md"). Entries also cache their stat()
+    result, so callers needing several fields stat each file once. Symlinked
+    directories are not followed and unreadable directories are skipped, as
+    with glob.
+
+    Args:
+        directory: Root directory to walk
+
+    Yields:
+        os.DirEntry[str]: Entry of each ".md" file found
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def iter_markdown_files(directory: Path) -> Iterator[Path]:
+    """
+    Recursively yield Markdown files below a directory.
+
+    Args:
+        directory: Root directory to walk
+
+    Yields:
+        Path: Path of each ".md" file found, see iter_markdown_entries
+    """
+    for entry in iter_markdown_entries(directory):
+        yield Path(entry.path)
+
+
+def corpus_fingerprint(directory: Path) -> str:
+    """
+    Fingerprint the Markdown files of a directory and how they are indexed.
+
+    Uses each file's path, size and modification time, so the corpus is not
+    read. Any added, removed or modified file changes the fingerprint, as do
+    changes to the chunking settings or the embedding model.
+
+    Args:
+        directory: Root directory of the Markdown corpus
+
+    Returns:
+        str: Hex digest identifying the current corpus and index settings
+    """
+    settings_instance = get_settings()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        repr(
+            (
+                settings_instance.CHUNK_SIZE,
+                settings_instance.CHUNK_OVERLAP,
+                tuple(settings_instance.separators),
+                settings_instance.EMBEDDING_MODEL,
+            )
+        ).encode()
+    )
+    for path in sorted(iter_markdown_files(directory)):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+# Header splitting configuration
+_HEADERS_TO_SPLIT_ON: tuple[tuple[str, str], ...] = (
+    ("#", "h1"),  # Document title
+    ("##", "h2"),  # Main sections
+    ("###", "h3"),  # Subsections
+)
+
+
+@lru_cache(maxsize=1)
+def _get_markdown_splitter() -> MarkdownHeaderTextSplitter:
+    """Build the header-aware splitter once and share it."""
+    return MarkdownHeaderTextSplitter(
+        headers_to_split_on=list(_HEADERS_TO_SPLIT_ON),
+        strip_headers=False,  # Keep headers for context
+        return_each_line=False,  # Keep paragraphs together
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_text_splitter(
+    chunk_size: int, chunk_overlap: int, separators: tuple[str, ...]
+) -> RecursiveCharacterTextSplitter:
+    """Build a content splitter once per configuration and share it."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        add_start_index=True,
+        separators=list(separators),
+        strip_whitespace=True,
+        keep_separator=True,
+    )
+
 
 class DocumentLoader:
     """
@@ -31,98 +155,109 @@ class DocumentLoader:
         settings_instance = get_settings()
 
         # Header splitting configuration
-        self.headers_to_split_on: list[tuple[str, str]] = [
-            ("#", "h1"),  # Document title
-            ("##", "h2"),  # Main sections
-            ("###", "h3"),  # Subsections
-        ]
-
-        # Header-aware markdown splitter
-        self.markdown_splitter = MarkdownHeaderTextSplitter(
-            headers_to_split_on=self.headers_to_split_on,
-            strip_headers=False,  # Keep headers for context
-            return_each_line=False,  # Keep paragraphs together
-        )
+        self.headers_to_split_on: list[tuple[str, str]] = list(_HEADERS_TO_SPLIT_ON)
+
+        # Header-aware markdown splitter, shared between loaders
+        self.markdown_splitter = _get_markdown_splitter()
 
-        # Content splitter with optimized parameters
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings_instance.CHUNK_SIZE,
-            chunk_overlap=settings_instance.CHUNK_OVERLAP,
-            length_function=len,
-            add_start_index=True,
-            separators=settings_instance.separators,
-            strip_whitespace=True,
-            keep_separator=True,
+        # Content splitter with optimized parameters, shared between loaders
+        self.text_splitter = _get_text_splitter(
+            settings_instance.CHUNK_SIZE,
+            settings_instance.CHUNK_OVERLAP,
+            tuple(settings_instance.separators),
         )
 
+        # Bound split methods and default directory, resolved once
+        self._split_markdown = self.markdown_splitter.split_text
+        self._split_chunks = self.text_splitter.split_documents
+        self.markdown_dir = Path(settings_instance.MARKDOWN_DIR)
+
+    def _process_file(self, file_path: Path) -> list[Document]:
+        """
+        Load and split a single Markdown file.
+
+        Splitters are only read here, so this is safe to run from several
+        threads at once.
+
+        Args:
+            file_path: Path of the Markdown file
+
+        Returns:
+            list[Document]: Enriched chunks, empty if the file failed to process
+        """
+        try:
+            # Read whole file content at once
+            content = file_path.read_text(encoding="utf-8")
+
+            # Extract URL from last non-blank line if present
+            source_url = None
+            line_start = content.rfind("\n", 0, len(content.rstrip())) + 1
+            url_match = _SOURCE_URL_PATTERN.fullmatch(content[line_start:].strip())
+            if url_match:
+                source_url = url_match.group(1)
+                logger.debug("Found source URL in %s: %s", file_path, source_url)
+                content = content[:line_start]
+            else:
+                logger.warning(f"No source URL found in {file_path}")
+
+            # First split by headers to maintain document structure
+            md_docs = self._split_markdown(content)
+
+            # Add source_url to each document before further splitting
+            for doc in md_docs:
+                doc.metadata["source_url"] = source_url
+
+            # Then split into size-appropriate chunks
+            chunks = self._split_chunks(md_docs)
+
+            # Enrich chunks with detailed metadata, file-level values are
+            # computed once and shared by all chunks of the file. The source
+            # URL is kept in metadata only, not in the embedded text.
+            base_meta = {
+                "source": str(file_path),
+                "file_name": file_path.name,
+                "page_id": file_path.stem,
+                "source_url": source_url,
+            }
+            for chunk in chunks:
+                # Defaults < splitter metadata < file metadata, built in one go
+                chunk.metadata = {
+                    **_CHUNK_META_DEFAULTS,
+                    **chunk.metadata,
+                    **base_meta,
+                    "doc_title": chunk.metadata.get("title", ""),
+                    "chunk_size": len(chunk.page_content),
+                }
+
+            logger.debug(
+                "Processed %s with URL %s: %d chunks",
+                file_path.name,
+                source_url,
+                len(chunks),
+            )
+            return chunks
+
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {str(e)}")
+            return []
+
     def load_documents(self, directory: Path | None = None) -> list[Document]:
         """Load and process Markdown documents from directory."""
-        settings_instance = get_settings()
         try:
-            doc_dir = Path(directory if directory else settings_instance.MARKDOWN_DIR)
+            doc_dir = Path(directory) if directory else self.markdown_dir
             documents: list[Document] = []
 
             if not doc_dir.exists():
                 logger.error(f"Directory not found: {doc_dir}")
                 return documents
 
-            for file_path in doc_dir.glob("**/*.md"):
-                try:
-                    # Read file content as lines
-                    with open(file_path, encoding="utf-8") as f:
-                        content_lines = f.readlines()
-
-                    # Extract URL from last line if present
-                    source_url = None
-                    if content_lines and content_lines[-1].strip().startswith("<http"):
-                        source_url = content_lines[-1].strip("<>").strip()
-                        if source_url.endswith(">"):
-                            source_url = source_url[:-1]
-                        logger.debug(f"Found source URL in {file_path}: {source_url}")
-                        content = "".join(content_lines[:-1])
-                    else:
-                        content = "".join(content_lines)
-                        logger.warning(f"No source URL found in {file_path}")
-
-                    # First split by headers to maintain document structure
-                    md_docs = self.markdown_splitter.split_text(content)
-
-                    # Add source_url to each document before further splitting
-                    for doc in md_docs:
-                        doc.metadata["source_url"] = source_url
-
-                    # Then split into size-appropriate chunks
-                    chunks = self.text_splitter.split_documents(md_docs)
-
-                    # Enrich chunks with detailed metadata
-                    for chunk in chunks:
-                        if source_url:
-                            chunk.page_content = (
-                                f"{chunk.page_content}\n\nSOURCE_URL: {source_url}"
-                            )
-
-                        chunk.metadata.update(
-                            {
-                                "source": str(file_path),
-                                "file_name": file_path.name,
-                                "page_id": file_path.stem,
-                                "doc_title": chunk.metadata.get("title", ""),
-                                "section": chunk.metadata.get("section", ""),
-                                "subsection": chunk.metadata.get("subsection", ""),
-                                "chunk_size": len(chunk.page_content),
-                                "source_url": source_url,
-                            }
-                        )
-
+            # Files are independent, process them concurrently. map() keeps
+            # the directory order so chunk ordering stays deterministic.
+            files = list(iter_markdown_files(doc_dir))
+            max_workers = min(32, (os.cpu_count() or 1) * 2, len(files) or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for chunks in executor.map(self._process_file, files):
                     documents.extend(chunks)
-                    logger.debug(
-                        f"Processed {file_path.name} with URL {source_url}: "
-                        f"{len(chunks)} chunks"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Error processing {file_path}: {str(e)}")
-                    continue
 
             # Log processing summary
             if documents:
@@ -135,10 +270,21 @@ class DocumentLoader:
                 )
                 # Log a sample chunk for verification
                 sample = documents[0]
-                logger.debug(f"Sample chunk metadata: {sample.metadata}")
+                logger.debug("Sample chunk metadata: %s", sample.metadata)
 
             return documents
 
         except Exception as e:
             logger.error(f"Error in document loading: {str(e)}")
             return []
+
+
+@lru_cache(maxsize=1)
+def get_document_loader() -> DocumentLoader:
+    """
+    Get the shared document loader instance.
+
+    Returns:
+        DocumentLoader: Loader built once per process with the current settings
+    """
+    return DocumentLoader()
@@ -2,6 +2,25 @@
 Embeddings module initialization.
 """
 
-from .ollama import get_embeddings
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["get_embeddings"]
+if TYPE_CHECKING:
+    from .cache import CachedEmbeddings
+    from .ollama import get_embeddings
+
+_LAZY_IMPORTS = {
+    "CachedEmbeddings": ".cache",
+    "get_embeddings": ".ollama",
+}
+
+__all__ = ["CachedEmbeddings", "get_embeddings"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported components on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,155 @@
+"""
+Embeddings cache module for the RAG Support application.
+Avoids recomputing embeddings for text that was already embedded.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from langchain_core.embeddings import Embeddings
+
+# Models may embed queries differently from documents, keep them apart
+_QUERY_PREFIX = "query:"
+
+
+def _content_key(text: str) -> str:
+    """Hash text content into a compact cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    In-memory LRU cache in front of an embeddings model.
+
+    Vectors are keyed by a hash of the text, so duplicate chunks, re-ingests
+    and repeated questions within the process only reach the model once.
+    Large sets of uncached texts are split into batches sent concurrently.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        maxsize: int,
+        batch_size: int = 64,
+        concurrency: int = 1,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            embeddings: Underlying embeddings model
+            maxsize: Maximum number of cached vectors, 0 disables caching
+            batch_size: Maximum number of texts per model request
+            concurrency: Maximum number of model requests in flight
+        """
+        self.embeddings = embeddings
+        self.maxsize = maxsize
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = Lock()
+
+    def _lookup(self, keys: list[str]) -> dict[str, list[float]]:
+        """Return cached vectors for the given keys, refreshing their order."""
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._cache.get(key)
+                if vector is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = vector
+        return found
+
+    def _store(self, keys: list[str], vectors: list[list[float]]) -> None:
+        """Store new vectors, evicting the least recently used ones."""
+        if not self.maxsize:
+            return
+        with self._lock:
+            for key, vector in zip(keys, vectors, strict=True):
+                self._cache[key] = vector
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def _plan(
+        self, texts: list[str]
+    ) -> tuple[list[str], dict[str, list[float]], list[str], list[str]]:
+        """Split texts into cached vectors and unique texts left to embed."""
+        keys = [_content_key(text) for text in texts]
+        found = self._lookup(keys)
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found and key not in missing:
+                missing[key] = text
+        return keys, found, list(missing), list(missing.values())
+
+    def _batches(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into model request batches."""
+        size = self.batch_size
+        return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+    def _embed_batches(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with up to `concurrency` batch requests in flight."""
+        batches = self._batches(texts)
+        if len(batches) == 1 or self.concurrency == 1:
+            results = map(self.embeddings.embed_documents, batches)
+            return [vector for batch in results for vector in batch]
+
+        workers = min(self.concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.embeddings.embed_documents, batches)
+            return [vector for batch in results for vector in batch]
+
+    async def _aembed_batches(self, texts: list[str]) -> list[list[float]]:
+        """Asynchronously embed texts with bounded concurrent batch requests."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(batch)
+
+        results = await asyncio.gather(
+            *(embed_batch(batch) for batch in self._batches(texts))
+        )
+        return [vector for batch in results for vector in batch]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents, only sending uncached texts to the model."""
+        keys, found, missing_keys, missing_texts = self._plan(texts)
+        if missing_texts:
+            vectors = self._embed_batches(missing_texts)
+            self._store(missing_keys, vectors)
+            found.update(zip(missing_keys, vectors, strict=True))
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query, reusing the cached vector when available."""
+        key = _QUERY_PREFIX + _content_key(text)
+        found = self._lookup([key])
+        if key in found:
+            return found[key]
+        vector = self.embeddings.embed_query(text)
+        self._store([key], [vector])
+        return vector
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Asynchronously embed documents, only sending uncached texts."""
+        keys, found, missing_keys, missing_texts = self._plan(texts)
+        if missing_texts:
+            vectors = await self._aembed_batches(missing_texts)
+            self._store(missing_keys, vectors)
+            found.update(zip(missing_keys, vectors, strict=True))
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Asynchronously embed a query, reusing the cached vector."""
+        key = _QUERY_PREFIX + _content_key(text)
+        found = self._lookup([key])
+        if key in found:
+            return found[key]
+        vector = await self.embeddings.aembed_query(text)
+        self._store([key], [vector])
+        return vector
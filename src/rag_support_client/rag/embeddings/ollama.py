@@ -3,67 +3,81 @@ Embeddings module for the RAG Support application.
 Handles embeddings configuration using LangChain v0.3.
 """
 
+from functools import lru_cache
 from typing import Any
 
+from langchain_core.embeddings import Embeddings
 from langchain_ollama import OllamaEmbeddings
-from pydantic import BaseModel, Field
 
 from rag_support_client.config.config import get_settings
+from rag_support_client.rag.embeddings.cache import CachedEmbeddings
 from rag_support_client.utils.logger import logger
 
-settings = get_settings()
 
-
-class EmbeddingsConfig(BaseModel):
-    """Embeddings configuration with Pydantic validation."""
-
-    model: str = Field(description="Name of the embedding model")
-    base_url: str = Field(description="Base URL for Ollama API")
-    client_kwargs: dict[str, Any] = Field(default_factory=dict)
-
-    class Config:
-        """Pydantic model configuration."""
-
-        extra = "forbid"
-        frozen = True
+@lru_cache(maxsize=8)
+def _create_embeddings(
+    model: str,
+    base_url: str,
+    client_kwargs: frozenset[tuple[str, Any]],
+    cache_size: int,
+    batch_size: int,
+    concurrency: int,
+) -> Embeddings:
+    """Build a cached embeddings client once per configuration."""
+    # Model and URL come from validated settings, OllamaEmbeddings validates
+    # any extra parameters itself
+    embeddings = OllamaEmbeddings(
+        model=model,
+        base_url=base_url,
+        **dict(client_kwargs),
+    )
+    logger.info(f"Initialized embeddings model: {model}")
+    return CachedEmbeddings(
+        embeddings,
+        maxsize=cache_size,
+        batch_size=batch_size,
+        concurrency=concurrency,
+    )
 
 
 def get_embeddings(
     model_name: str | None = None,
     base_url: str | None = None,
     **kwargs: Any,
-) -> OllamaEmbeddings:
+) -> Embeddings:
     """
-    Create and configure cached Ollama embeddings instance.
+    Get the configured Ollama embeddings instance.
 
     Args:
         model_name: Optional model name override
         base_url: Optional base URL override
         **kwargs: Additional configuration parameters for OllamaEmbeddings
 
+    Missing values are resolved from the current settings and instances are
+    cached per effective configuration, so the vector store manager, the
+    retriever and the admin tools all share a single embeddings client. The
+    client is wrapped in an LRU cache of EMBEDDING_CACHE_SIZE vectors, and
+    uncached texts are sent in EMBEDDING_BATCH_SIZE batches with up to
+    EMBEDDING_CONCURRENCY requests in flight.
+
     Returns:
-        OllamaEmbeddings: The configured embeddings instance
+        Embeddings: The configured embeddings instance
 
     Raises:
         ValueError: If configuration validation fails
         Exception: If embeddings initialization fails
     """
+    current = get_settings()
     try:
-        config = EmbeddingsConfig(
-            model=model_name or settings.EMBEDDING_MODEL,
-            base_url=base_url or settings.OLLAMA_BASE_URL,
+        return _create_embeddings(
+            model_name or current.EMBEDDING_MODEL,
+            base_url or current.OLLAMA_BASE_URL,
+            frozenset(kwargs.items()),
+            current.EMBEDDING_CACHE_SIZE,
+            current.EMBEDDING_BATCH_SIZE,
+            current.EMBEDDING_CONCURRENCY,
         )
 
-        embeddings_config = {
-            "model": config.model,
-            "base_url": config.base_url,
-            **kwargs,
-        }
-
-        embeddings = OllamaEmbeddings(**embeddings_config)
-        logger.info(f"Initialized embeddings model: {config.model}")
-        return embeddings
-
     except Exception as e:
         logger.error(f"Embeddings initialization error: {str(e)}")
         raise
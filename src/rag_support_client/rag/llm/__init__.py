@@ -3,6 +3,19 @@ LLM package initialization.
 Exports the main chain creation function.
 """
 
-from .ollama import create_chain
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ollama import create_chain
 
 __all__ = ["create_chain"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the chain factory on first access."""
+    if name == "create_chain":
+        value = import_module(".ollama", __name__).create_chain
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,11 +6,18 @@ Returns:
     Configured RAG chain with Ollama LLM
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from functools import lru_cache
 from typing import Any
 
+import httpx
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables import RunnableLambda, RunnableParallel
+from langchain_core.runnables.utils import AddableDict
 from langchain_ollama import OllamaLLM
 
 from rag_support_client.config.config import get_settings
@@ -20,20 +27,77 @@ from rag_support_client.utils.logger import logger
 settings = get_settings()
 
 
-def get_llm() -> OllamaLLM:
-    """Initialize Ollama LLM with configuration settings"""
-    return OllamaLLM(
-        model=settings.LLM_MODEL,
-        base_url=settings.OLLAMA_BASE_URL,
-        temperature=settings.LLM_TEMPERATURE,
+@lru_cache(maxsize=4)
+def _create_llm(model: str, base_url: str, temperature: float) -> OllamaLLM:
+    """Build an Ollama LLM client once per configuration."""
+    logger.info(f"Initialized LLM model: {model}")
+    return OllamaLLM(model=model, base_url=base_url, temperature=temperature)
+
+
+def get_llm(
+    model: str | None = None,
+    base_url: str | None = None,
+    temperature: float | None = None,
+) -> OllamaLLM:
+    """
+    Get the Ollama LLM for the given configuration.
+
+    Missing values are resolved from the current settings, so instances are
+    shared per effective configuration and a settings reload yields a new one.
+
+    Args:
+        model: Optional model name override
+        base_url: Optional base URL override
+        temperature: Optional temperature override
+
+    Returns:
+        OllamaLLM: The cached LLM instance
+    """
+    current = get_settings()
+    return _create_llm(
+        model or current.LLM_MODEL,
+        base_url or current.OLLAMA_BASE_URL,
+        current.LLM_TEMPERATURE if temperature is None else temperature,
     )
 
 
+async def warmup_llm() -> None:
+    """
+    Ask Ollama to load the configured model into memory.
+
+    An empty generate request only loads the model, so this can run alongside
+    other startup work. Failures are logged and otherwise ignored.
+    """
+    try:
+        async with httpx.AsyncClient(timeout=settings.OLLAMA_TIMEOUT) as client:
+            response = await client.post(
+                f"{settings.OLLAMA_BASE_URL}/api/generate",
+                json={"model": settings.LLM_MODEL},
+            )
+            response.raise_for_status()
+        logger.info(f"Warmed up LLM model: {settings.LLM_MODEL}")
+    except Exception as e:
+        logger.warning(f"LLM warmup failed: {str(e)}")
+
+
 def create_chain(
     vectorstore: Chroma,
     conversation_manager: ConversationManager | None = None,
 ) -> RunnableParallel:
-    """Create RAG chain with conversation management"""
+    """
+    Create RAG chain with conversation management.
+
+    Args:
+        vectorstore: Vector store used for document retrieval
+        conversation_manager: Optional manager providing the chat history
+
+    Returns:
+        RunnableParallel: Chain taking {"question", "session_id"}. invoke() and
+        ainvoke() return {"result": {"response", "source_documents"}} once the
+        answer is complete; stream() and astream() yield {"result": ...}
+        chunks, the first carrying the source documents and the following
+        ones one response token each.
+    """
 
     try:
         # Initialize LLM
@@ -53,19 +117,19 @@ def create_chain(
             ]
         )
 
-        def process_query(input_dict: dict[str, Any]) -> dict[str, Any]:
-            # Get documents
-            docs = retriever.invoke(input_dict["question"])
-
-            # Get chat history if available
-            chat_history = []
+        def get_chat_history(input_dict: dict[str, Any]) -> list[dict]:
+            # Get chat history if available, last 6 exchanges
             if conversation_manager and input_dict.get("session_id"):
-                chat_history = conversation_manager.get_history(
-                    str(input_dict["session_id"])
-                )[
-                    -12:
-                ]  # Last 6 exchanges
-
+                return conversation_manager.get_recent(
+                    str(input_dict["session_id"]), 12
+                )
+            return []
+
+        def build_messages(
+            input_dict: dict[str, Any],
+            docs: list[Document],
+            chat_history: list[dict],
+        ) -> list[BaseMessage]:
             # Prepare prompt variables
             prompt_vars = {
                 "chat_history": chat_history,
@@ -73,19 +137,39 @@ def create_chain(
                 "context": "\n\n".join(doc.page_content for doc in docs),
             }
 
-            # Get LLM response
-            messages = prompt.invoke(prompt_vars).to_messages()
-            response = llm.invoke(messages)
+            return prompt.invoke(prompt_vars).to_messages()
 
-            return {
-                "response": response,
-                "source_documents": docs,
-            }
+        # The result step yields the source documents first, then one chunk per
+        # generated token. Chunks are AddableDicts, so invoke() aggregates them
+        # into {"response": <full text>, "source_documents": [...]} while
+        # stream()/astream() forward each token as soon as Ollama produces it.
+        def process_query(input_dict: dict[str, Any]) -> Iterator[AddableDict]:
+            docs = retriever.invoke(input_dict["question"])
+            yield AddableDict(response="", source_documents=docs)
+
+            messages = build_messages(input_dict, docs, get_chat_history(input_dict))
+            for token in llm.stream(messages):
+                yield AddableDict(response=token)
+
+        async def aprocess_query(
+            input_dict: dict[str, Any],
+        ) -> AsyncIterator[AddableDict]:
+            # History is read off the event loop (it may wait on the session
+            # lock) while the similarity search runs
+            docs, chat_history = await asyncio.gather(
+                retriever.ainvoke(input_dict["question"]),
+                asyncio.to_thread(get_chat_history, input_dict),
+            )
+            yield AddableDict(response="", source_documents=docs)
+
+            messages = build_messages(input_dict, docs, chat_history)
+            async for token in llm.astream(messages):
+                yield AddableDict(response=token)
 
         # Create chain
         chain = RunnableParallel(
             {
-                "result": RunnableLambda(process_query),
+                "result": RunnableLambda(process_query, afunc=aprocess_query),
             }
         )
 
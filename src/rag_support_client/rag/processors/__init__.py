@@ -1,5 +1,5 @@
 """Processors module initialization."""
 
-from .loader import DocumentLoader
+from .loader import DocumentLoader, get_document_loader
 
-__all__ = ["DocumentLoader"]
+__all__ = ["DocumentLoader", "get_document_loader"]
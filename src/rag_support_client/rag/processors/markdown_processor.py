@@ -102,7 +102,7 @@ class MarkdownProcessor:
                     )
 
             logger.debug(
-                f"Processed {file_path.name}: {len(processed_chunks)} chunks created"
+                "Processed %s: %d chunks created", file_path.name, len(processed_chunks)
             )
             return processed_chunks
 
@@ -3,9 +3,13 @@ Enhanced confidence scoring module for RAG responses.
 """
 
 import re
-from difflib import SequenceMatcher
+import string
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import pairwise
 from typing import TypedDict
 
+import numpy as np
 from langchain.schema import Document
 
 from rag_support_client.config.config import get_settings
@@ -13,6 +17,48 @@ from rag_support_client.utils.logger import logger
 
 settings = get_settings()
 
+# Patterns used by the scorers, compiled once at import
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+_DATE_RE = re.compile(r"\d{1,2}[-/]\d{1,2}[-/]\d{2,4}")
+_STRUCTURE_RE = re.compile(r"(?P<step>[0-9]\.)|(?P<paragraph>\n\n)|(?P<punct>[,;:()])")
+
+# Punctuation to blank out before splitting text into words, including the
+# typographic quotes and dashes common in French documentation. Underscores
+# stay part of words, as with \w.
+_PUNCT_TABLE = str.maketrans(
+    {
+        char: " "
+        for char in string.punctuation + "\u2018\u2019\u201c\u201d«»…–—"
+        if char != "_"
+    }
+)
+
+# (negative pattern in answer, positive pattern in document) pairs
+_NEG_PAIRS = [
+    (re.compile(neg_pattern), re.compile(pos_pattern))
+    for neg_pattern, pos_pattern in [
+        (r"ne \w+ pas", r"\w+"),
+        (r"n'(?:est|était) pas", r"est|était"),
+        (r"impossible", r"possible"),
+        (r"jamais", r"toujours"),
+    ]
+]
+
+# (question word, answer terms) checked in order, only the first question word
+# found in the question counts
+_COHERENCE_TERMS = (
+    ("comment", ("voici", "il faut", "vous devez", "vous pouvez")),
+    ("pourquoi", ("car", "parce que", "puisque", "en effet")),
+    ("quand", ("lorsque", "pendant", "durant", "après", "avant")),
+    ("où", ("dans", "à", "sur", "chez")),
+)
+_COMPLETENESS_TERMS = (
+    ("comment", ("étapes", "procédure", "méthode")),
+    ("pourquoi", ("raison", "cause", "explication")),
+    ("quand", ("moment", "période", "date")),
+    ("où", ("emplacement", "lieu", "localisation")),
+)
+
 
 class ConfidenceResult(TypedDict):
     """Type definition for confidence calculation result."""
@@ -28,6 +74,69 @@ class ConfidenceResult(TypedDict):
     contradictions: list[str]
 
 
+# Retrieved chunks repeat across queries, so per-document extractions are
+# cached by content (header path or page content) rather than recomputed
+@lru_cache(maxsize=1024)
+def _header_terms(header_path: str) -> tuple[tuple[str, str], ...]:
+    """Split a header path into (term, lowercase term) pairs."""
+    return tuple((term, term.lower()) for term in header_path.split(" > "))
+
+
+@lru_cache(maxsize=1024)
+def _body_headers(page_content: str) -> tuple[tuple[str, str], ...]:
+    """Extract Markdown headers from a chunk as (header, lowercase) pairs."""
+    headers = []
+    for line in page_content.splitlines():
+        # "#" markers followed by whitespace and some text
+        if line.startswith("#"):
+            text = line.lstrip("#")
+            if text[:1].isspace() and not text.isspace():
+                headers.append(text.lstrip())
+    return tuple((header, header.lower()) for header in headers)
+
+
+def _close_numbers(
+    answer_numbers: list[str], doc_numbers: list[str]
+) -> Iterator[tuple[str, str]]:
+    """
+    Find distinct numbers within 10% of each other.
+
+    Document numbers are sorted once and each answer number only looks at the
+    candidates inside its tolerance window, instead of every document number.
+
+    Args:
+        answer_numbers: Numbers found in the answer
+        doc_numbers: Numbers found in a document
+
+    Yields:
+        tuple[str, str]: (answer number, document number) pairs that differ by
+        less than 10% of the larger value
+    """
+    if not answer_numbers or not doc_numbers:
+        return
+
+    values = np.fromiter(map(float, doc_numbers), dtype=np.float64)
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    sorted_strings = [doc_numbers[i] for i in order]
+
+    for ans_num in answer_numbers:
+        ans_value = float(ans_num)
+        # Window slightly wider than the tolerance, refined by the exact test
+        start = int(np.searchsorted(sorted_values, ans_value * 0.9, side="left"))
+        end = int(np.searchsorted(sorted_values, ans_value / 0.9, side="right"))
+        for index in range(start, end):
+            doc_num = sorted_strings[index]
+            doc_value = float(sorted_values[index])
+            largest = max(ans_value, doc_value)
+            if (
+                ans_num != doc_num
+                and largest > 0
+                and abs(ans_value - doc_value) / largest < 0.1
+            ):
+                yield ans_num, doc_num
+
+
 def calculate_similarity_score(documents: list[Document]) -> float:
     """
     Calculate similarity score based on ChromaDB's similarity scores.
@@ -43,23 +152,18 @@ def calculate_similarity_score(documents: list[Document]) -> float:
         return 0.0
 
     try:
-        # Get similarity scores from metadata
-        scored_docs = []
+        # Keep the highest similarity among documents above threshold
+        threshold = settings.SIMILARITY_THRESHOLD
+        best = 0.0
         for doc in documents:
             score = doc.metadata.get("similarity_score", 0.0)
             if isinstance(score, int | float):
                 # ChromaDB returns a distance, convert to similarity
                 similarity = 1.0 - min(1.0, float(score))
-                # Only keep documents above threshold
-                if similarity >= settings.SIMILARITY_THRESHOLD:
-                    scored_docs.append((doc, similarity))
-
-        if not scored_docs:
-            return 0.0
+                if similarity >= threshold and similarity > best:
+                    best = similarity
 
-        # Sort by similarity and keep only top document
-        scored_docs.sort(key=lambda x: x[1], reverse=True)
-        return scored_docs[0][1]  # Return highest similarity score
+        return best
 
     except Exception as e:
         logger.error(f"Error calculating similarity score: {str(e)}")
@@ -67,7 +171,12 @@ def calculate_similarity_score(documents: list[Document]) -> float:
 
 
 def calculate_coherence_score(
-    question: str, answer: str, documents: list[Document]
+    question: str,
+    answer: str,
+    documents: list[Document],
+    *,
+    question_lower: str | None = None,
+    answer_lower: str | None = None,
 ) -> float:
     """
     Calculate coherence between question and answer.
@@ -76,14 +185,23 @@ def calculate_coherence_score(
         question: Original question
         answer: Generated answer
         documents: Retrieved documents
+        question_lower: Optional precomputed lowercase question
+        answer_lower: Optional precomputed lowercase answer
 
     Returns:
         float: Coherence score
     """
     try:
         # Extract key terms from question
-        question_terms = set(re.findall(r"\w+", question.lower()))
-        answer_terms = set(re.findall(r"\w+", answer.lower()))
+        if question_lower is None:
+            question_lower = question.lower()
+        if answer_lower is None:
+            answer_lower = answer.lower()
+
+        question_tokens = question_lower.translate(_PUNCT_TABLE).split()
+        answer_tokens = answer_lower.translate(_PUNCT_TABLE).split()
+        question_terms = set(question_tokens)
+        answer_terms = set(answer_tokens)
 
         # Calculate direct term overlap
         if not question_terms:
@@ -92,21 +210,20 @@ def calculate_coherence_score(
         overlap_score = len(question_terms & answer_terms) / len(question_terms)
 
         # Check if answer directly addresses question type
-        question_types = {
-            "comment": ["voici", "il faut", "vous devez", "vous pouvez"],
-            "pourquoi": ["car", "parce que", "puisque", "en effet"],
-            "quand": ["lorsque", "pendant", "durant", "après", "avant"],
-            "où": ["dans", "à", "sur", "chez"],
-        }
-
-        for q_word, expected_terms in question_types.items():
-            if q_word in question.lower():
-                if any(term in answer.lower() for term in expected_terms):
+        for q_word, expected_terms in _COHERENCE_TERMS:
+            if q_word in question_lower:
+                if any(term in answer_lower for term in expected_terms):
                     overlap_score += 0.2
                 break
 
-        # Calculate sentence structure similarity
-        similarity = SequenceMatcher(None, question, answer[: len(question)]).ratio()
+        # Calculate sentence structure similarity as the Jaccard index of the
+        # word bigrams of the question and the start of the answer
+        question_bigrams = set(pairwise(question_tokens))
+        answer_head = answer_tokens[: len(question_tokens)]
+        answer_bigrams = set(pairwise(answer_head))
+        similarity = len(question_bigrams & answer_bigrams) / max(
+            1, len(question_bigrams | answer_bigrams)
+        )
 
         return min(1.0, (overlap_score * 0.7 + similarity * 0.3))
 
@@ -116,7 +233,10 @@ def calculate_coherence_score(
 
 
 def detect_contradictions(
-    answer: str, documents: list[Document]
+    answer: str,
+    documents: list[Document],
+    *,
+    answer_lower: str | None = None,
 ) -> tuple[float, list[str]]:
     """
     Detect potential contradictions between answer and source documents.
@@ -124,6 +244,7 @@ def detect_contradictions(
     Args:
         answer: Generated answer
         documents: Retrieved documents
+        answer_lower: Optional precomputed lowercase answer
 
     Returns:
         tuple[float, list[str]]: Consistency score and list of detected contradictions
@@ -131,28 +252,33 @@ def detect_contradictions(
     try:
         contradictions = []
         consistency_score = 1.0
+        penalty = settings.CONTRADICTION_PENALTY
 
         # Extract numerical values and dates from answer and documents
-        answer_numbers = re.findall(r"\d+(?:\.\d+)?", answer)
-        answer_dates = re.findall(r"\d{1,2}[-/]\d{1,2}[-/]\d{2,4}", answer)
+        answer_numbers = _NUM_RE.findall(answer)
+        answer_dates = _DATE_RE.findall(answer)
+
+        # Negations only depend on the answer, documents are then only
+        # searched for the positive forms of negations actually present
+        if answer_lower is None:
+            answer_lower = answer.lower()
+        doc_patterns = [
+            pos_pattern
+            for neg_pattern, pos_pattern in _NEG_PAIRS
+            if neg_pattern.search(answer_lower)
+        ]
 
         for doc in documents:
-            doc_numbers = re.findall(r"\d+(?:\.\d+)?", doc.page_content)
-            doc_dates = re.findall(r"\d{1,2}[-/]\d{1,2}[-/]\d{2,4}", doc.page_content)
+            content = doc.page_content
+            doc_numbers = _NUM_RE.findall(content)
+            doc_dates = _DATE_RE.findall(content)
 
             # Check for numerical contradictions
-            for ans_num in answer_numbers:
-                for doc_num in doc_numbers:
-                    if (
-                        ans_num != doc_num
-                        and abs(float(ans_num) - float(doc_num))
-                        / max(float(ans_num), float(doc_num))
-                        < 0.1
-                    ):
-                        contradictions.append(
-                            f"Potential numerical inconsistency: {ans_num} vs {doc_num}"
-                        )
-                        consistency_score -= settings.CONTRADICTION_PENALTY
+            for ans_num, doc_num in _close_numbers(answer_numbers, doc_numbers):
+                contradictions.append(
+                    f"Potential numerical inconsistency: {ans_num} vs {doc_num}"
+                )
+                consistency_score -= penalty
 
             # Check for date contradictions
             for ans_date in answer_dates:
@@ -161,23 +287,17 @@ def detect_contradictions(
                         contradictions.append(
                             f"Potential date inconsistency: {ans_date} vs {doc_date}"
                         )
-                        consistency_score -= settings.CONTRADICTION_PENALTY
+                        consistency_score -= penalty
 
             # Check for negation contradictions
-            negation_pairs = [
-                (r"ne \w+ pas", r"\w+"),
-                (r"n'(?:est|était) pas", r"est|était"),
-                (r"impossible", r"possible"),
-                (r"jamais", r"toujours"),
-            ]
-
-            for neg_pattern, pos_pattern in negation_pairs:
-                neg_in_answer = bool(re.search(neg_pattern, answer.lower()))
-                pos_in_doc = bool(re.search(pos_pattern, doc.page_content.lower()))
-
-                if neg_in_answer and pos_in_doc:
-                    contradictions.append("Potential logical contradiction detected")
-                    consistency_score -= settings.CONTRADICTION_PENALTY
+            if doc_patterns:
+                content_lower = content.lower()
+                for pos_pattern in doc_patterns:
+                    if pos_pattern.search(content_lower):
+                        contradictions.append(
+                            "Potential logical contradiction detected"
+                        )
+                        consistency_score -= penalty
 
         return max(0.0, consistency_score), contradictions
 
@@ -187,7 +307,12 @@ def detect_contradictions(
 
 
 def calculate_completeness_score(
-    question: str, answer: str, documents: list[Document]
+    question: str,
+    answer: str,
+    documents: list[Document],
+    *,
+    question_lower: str | None = None,
+    answer_lower: str | None = None,
 ) -> float:
     """
     Evaluate the completeness of the answer.
@@ -196,11 +321,18 @@ def calculate_completeness_score(
         question: Original question
         answer: Generated answer
         documents: Retrieved documents
+        question_lower: Optional precomputed lowercase question
+        answer_lower: Optional precomputed lowercase answer
 
     Returns:
         float: Completeness score
     """
     try:
+        if question_lower is None:
+            question_lower = question.lower()
+        if answer_lower is None:
+            answer_lower = answer.lower()
+
         score = 0.0
 
         # Length assessment
@@ -213,28 +345,20 @@ def calculate_completeness_score(
             score += 0.6  # Penalize overly long answers
 
         # Check for expected answer components
-        question_indicators = {
-            "comment": ["étapes", "procédure", "méthode"],
-            "pourquoi": ["raison", "cause", "explication"],
-            "quand": ["moment", "période", "date"],
-            "où": ["emplacement", "lieu", "localisation"],
-        }
-
-        for indicator_type, expected_terms in question_indicators.items():
-            if indicator_type in question.lower():
-                if any(term in answer.lower() for term in expected_terms):
+        for indicator_type, expected_terms in _COMPLETENESS_TERMS:
+            if indicator_type in question_lower:
+                if any(term in answer_lower for term in expected_terms):
                     score += 0.2
                 break
 
         # Check coverage of source material key points
-        key_points = set()
+        key_points: set[tuple[str, str]] = set()
         for doc in documents:
             # Extract section headers or important phrases
-            headers = re.findall(r"^#+\s+(.+)$", doc.page_content, re.MULTILINE)
-            key_points.update(headers)
+            key_points.update(_body_headers(doc.page_content))
 
         covered_points = sum(
-            1 for point in key_points if point.lower() in answer.lower()
+            1 for _, point_lower in key_points if point_lower in answer_lower
         )
         if key_points:
             coverage_ratio = covered_points / len(key_points)
@@ -248,7 +372,11 @@ def calculate_completeness_score(
 
 
 def calculate_relevance_score(
-    question: str, answer: str, documents: list[Document]
+    question: str,
+    answer: str,
+    documents: list[Document],
+    *,
+    answer_lower: str | None = None,
 ) -> float:
     """
     Calculate relevance score based on answer content and metadata.
@@ -257,12 +385,16 @@ def calculate_relevance_score(
         question: Original question
         answer: Generated answer
         documents: Retrieved documents
+        answer_lower: Optional precomputed lowercase answer
 
     Returns:
         float: Calculated relevance score
     """
     try:
-        if not answer or answer.lower().startswith("je n'ai pas"):
+        if answer_lower is None:
+            answer_lower = answer.lower()
+
+        if not answer or answer_lower.startswith("je n'ai pas"):
             return 0.0
 
         score = 0.0
@@ -277,15 +409,15 @@ def calculate_relevance_score(
             score += 0.8
 
         # Check if answer contains technical terms from context
-        technical_terms = set()
+        technical_terms: set[tuple[str, str]] = set()
         for doc in documents:
             header_path = doc.metadata.get("header_path", "")
             if header_path:
-                technical_terms.update(header_path.split(" > "))
+                technical_terms.update(_header_terms(header_path))
 
         # Count technical terms in answer
         term_count = sum(
-            1 for term in technical_terms if term.lower() in answer.lower()
+            1 for _, term_lower in technical_terms if term_lower in answer_lower
         )
         if term_count > 0:
             score += min(0.2, term_count * 0.05)  # Max bonus of 0.2
@@ -311,12 +443,18 @@ def calculate_coverage_score(answer: str, documents: list[Document]) -> float:
     try:
         score = 0.0
 
-        # Structure scoring
-        if any(str(i) + "." in answer for i in range(10)):
+        # Structure scoring, a single scan stopping once all features are seen
+        features: set[str | None] = set()
+        for match in _STRUCTURE_RE.finditer(answer):
+            features.add(match.lastgroup)
+            if len(features) == 3:
+                break
+
+        if "step" in features:
             score += 0.3  # Numbered steps
-        if answer.count("\n\n") > 0:
+        if "paragraph" in features:
             score += 0.2  # Multiple paragraphs
-        if any(p in answer for p in [",", ";", ":", "(", ")"]):
+        if "punct" in features:
             score += 0.1  # Rich punctuation
 
         # Check if answer covers multiple sections from context
@@ -351,13 +489,48 @@ def calculate_confidence(
         ConfidenceResult: Extended confidence scores and details
     """
     try:
-        # Calculate all scores
+        # Without any document above the similarity threshold the answer is not
+        # grounded, skip the text-based scorers
         similarity = calculate_similarity_score(documents)
-        relevance = calculate_relevance_score(question, answer, documents)
+        if similarity == 0.0:
+            return {
+                "total": 0.0,
+                "similarity": 0.0,
+                "relevance": 0.0,
+                "coverage": 0.0,
+                "coherence": 0.0,
+                "consistency": 0.0,
+                "completeness": 0.0,
+                "quality": "needs_improvement",
+                "contradictions": [],
+            }
+
+        # Lowercase once and share with every scorer
+        question_lower = question.lower()
+        answer_lower = answer.lower()
+
+        # Calculate all other scores
+        relevance = calculate_relevance_score(
+            question, answer, documents, answer_lower=answer_lower
+        )
         coverage = calculate_coverage_score(answer, documents)
-        coherence = calculate_coherence_score(question, answer, documents)
-        consistency, contradictions = detect_contradictions(answer, documents)
-        completeness = calculate_completeness_score(question, answer, documents)
+        coherence = calculate_coherence_score(
+            question,
+            answer,
+            documents,
+            question_lower=question_lower,
+            answer_lower=answer_lower,
+        )
+        consistency, contradictions = detect_contradictions(
+            answer, documents, answer_lower=answer_lower
+        )
+        completeness = calculate_completeness_score(
+            question,
+            answer,
+            documents,
+            question_lower=question_lower,
+            answer_lower=answer_lower,
+        )
 
         # Calculate weighted total score
         total = (
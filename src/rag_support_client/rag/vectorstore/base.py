@@ -2,6 +2,8 @@
 Base module for vector store operations.
 """
 
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from langchain.docstore.document import Document
@@ -9,6 +11,7 @@ from langchain.schema.embeddings import Embeddings
 from langchain_chroma import Chroma
 
 from rag_support_client.config.config import settings
+from rag_support_client.rag.embeddings.cache import CachedEmbeddings
 from rag_support_client.rag.embeddings.ollama import get_embeddings
 from rag_support_client.utils.logger import logger
 
@@ -50,15 +53,41 @@ class VectorStoreManager:
             )
 
             logger.info(f"Processing {len(documents)} documents through Chroma")
-            logger.debug("Starting Chroma.from_documents")
 
-            vectorstore = Chroma.from_documents(
-                documents=documents,
-                embedding=manager.embedding_function,
+            vectorstore = Chroma(
+                embedding_function=manager.embedding_function,
                 persist_directory=manager.persist_directory,
                 collection_name=manager.collection_name,
             )
 
+            # Write in batches that keep every concurrent embed request busy.
+            # With a large enough embeddings cache, the next batch is embedded
+            # in the background while the current one is written to Chroma.
+            batch_size = settings.EMBEDDING_BATCH_SIZE * settings.EMBEDDING_CONCURRENCY
+            batches = [
+                documents[i : i + batch_size]
+                for i in range(0, len(documents), batch_size)
+            ]
+            embeddings = manager.embedding_function
+            prefetch = (
+                isinstance(embeddings, CachedEmbeddings)
+                and embeddings.maxsize >= 2 * batch_size
+            )
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending: Future | None = None
+                for number, batch in enumerate(batches, 1):
+                    if pending is not None:
+                        pending.result()
+                        pending = None
+                    if prefetch and number < len(batches):
+                        pending = executor.submit(
+                            embeddings.embed_documents,
+                            [doc.page_content for doc in batches[number]],
+                        )
+                    vectorstore.add_documents(batch)
+                    logger.debug("Stored batch %d/%d", number, len(batches))
+
             logger.info("Vectorstore created successfully")
             return vectorstore
 
@@ -81,3 +110,73 @@ class VectorStoreManager:
             persist_directory=manager.persist_directory,
             collection_name=manager.collection_name,
         )
+
+    @staticmethod
+    def load_or_create(
+        load_documents: Callable[[], list[Document]],
+        persist_directory: str | Path | None = None,
+        collection_name: str | None = None,
+        rebuild: bool = False,
+        fingerprint: str | None = None,
+    ) -> Chroma:
+        """
+        Reuse the persisted vector store, embedding documents only when needed.
+
+        Args:
+            load_documents: Callable returning the documents to embed, only
+                invoked when the persisted collection is empty or a rebuild is
+                requested
+            persist_directory: Optional persistence directory override
+            collection_name: Optional collection name override
+            rebuild: Drop the persisted collection and re-embed all documents
+            fingerprint: Optional corpus fingerprint, the collection is rebuilt
+                when it differs from the one recorded at the last build
+
+        Returns:
+            Chroma: Ready-to-use vector store
+        """
+        vectorstore = VectorStoreManager.get_existing_vectorstore(
+            persist_directory=persist_directory, collection_name=collection_name
+        )
+        index_dir = Path(persist_directory or settings.CHROMA_PERSIST_DIRECTORY)
+        index_name = collection_name or settings.CHROMA_COLLECTION_NAME
+        fingerprint_file = index_dir / f"{index_name}.fingerprint"
+
+        stored = None
+        if fingerprint is not None:
+            try:
+                stored = fingerprint_file.read_text(encoding="utf-8")
+            except OSError:
+                stored = None
+            if not rebuild and stored is not None and stored != fingerprint:
+                logger.info("Document corpus changed since last index build")
+                rebuild = True
+
+        if not rebuild:
+            count = vectorstore._collection.count()
+            if count > 0:
+                logger.info(f"Loaded persisted vectorstore with {count} embeddings")
+                # Adopt indexes built before fingerprints were recorded
+                if fingerprint is not None and stored is None:
+                    fingerprint_file.write_text(fingerprint, encoding="utf-8")
+                return vectorstore
+
+        # Load before dropping anything, a failing loader keeps the current index
+        documents = load_documents()
+
+        if rebuild:
+            logger.info("Rebuild requested, dropping persisted collection")
+            # Blank the recorded fingerprint so a build interrupted from here
+            # on is neither reused nor adopted at the next start
+            if fingerprint is not None:
+                fingerprint_file.write_text("", encoding="utf-8")
+            vectorstore.delete_collection()
+
+        vectorstore = VectorStoreManager.create_vectorstore(
+            documents,
+            persist_directory=persist_directory,
+            collection_name=collection_name,
+        )
+        if fingerprint is not None:
+            fingerprint_file.write_text(fingerprint, encoding="utf-8")
+        return vectorstore
@@ -2,6 +2,7 @@
 
 import atexit
 import os
+import threading
 from pathlib import Path
 from typing import Any, NoReturn, cast
 
@@ -9,7 +10,10 @@ from langchain.vectorstores import Chroma
 
 import streamlit as st
 from rag_support_client.config.config import get_settings
-from rag_support_client.rag.document_loader import DocumentLoader
+from rag_support_client.rag.document_loader import (
+    corpus_fingerprint,
+    get_document_loader,
+)
 from rag_support_client.rag.llm.ollama import create_chain
 from rag_support_client.rag.vectorstore.base import VectorStoreManager
 from rag_support_client.utils.logger import logger
@@ -22,6 +26,8 @@ settings = get_settings()
 _global_vectorstore: Chroma | None = None
 _global_rag_chain: Any | None = None
 _is_initialized: bool = False
+# Serializes initialization across concurrently starting sessions
+_init_lock = threading.Lock()
 
 # Type hint for Streamlit module
 St = cast(DeltaGenerator, st)
@@ -77,12 +83,22 @@ def initialize_rag_components() -> None:
     """Initialize RAG components globally."""
     global _global_vectorstore, _global_rag_chain, _is_initialized
 
+    if _is_initialized:
+        return
+
     try:
-        if not _is_initialized:
-            # Load documents and create vectorstore
-            loader = DocumentLoader()
-            documents = loader.load_documents()
-            _global_vectorstore = VectorStoreManager.create_vectorstore(documents)
+        with _init_lock:
+            # Another session may have initialized while we waited
+            if _is_initialized:
+                return
+
+            # Reuse the persisted vectorstore while the corpus is unchanged,
+            # documents are only loaded and embedded when a build is needed
+            _global_vectorstore = VectorStoreManager.load_or_create(
+                get_document_loader().load_documents,
+                rebuild=settings.REBUILD_INDEX,
+                fingerprint=corpus_fingerprint(Path(settings.MARKDOWN_DIR)),
+            )
 
             # Create RAG chain
             _global_rag_chain = create_chain(_global_vectorstore)
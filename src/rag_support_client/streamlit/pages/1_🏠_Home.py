@@ -1,29 +1,35 @@
 """Home page for the RAG application with chat interface."""
 
 import logging
-from typing import Any
+from collections import deque
+from logging.handlers import RotatingFileHandler
 
 import streamlit as st
+from langchain_core.documents import Document
+from langchain_core.runnables import Runnable
 
 from rag_support_client.config.config import get_settings
 from rag_support_client.streamlit import get_rag_chain
 from rag_support_client.streamlit.components import Page
 from rag_support_client.streamlit.types import DeltaGenerator
-from rag_support_client.utils.logger import logger
+from rag_support_client.utils.logger import get_log_level, logger
 from rag_support_client.utils.state import app_state
 
-# Configure logging to show debug messages
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),  # Print to console
-        logging.FileHandler("rag_debug.log"),  # Save to file
-    ],
-)
-
 settings = get_settings()
 
+# Configure root logging once, Streamlit executes this module on every rerun
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=get_log_level(settings.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),  # Print to console
+            RotatingFileHandler(  # Save to file
+                "rag_debug.log", maxBytes=10 << 20, backupCount=3
+            ),
+        ],
+    )
+
 
 class HomePage(Page):
     """Home page component with RAG chat interface"""
@@ -40,7 +46,8 @@ class HomePage(Page):
                 app_state.conversation_manager.create_session_id()
             )
         if "chat_history" not in st.session_state:
-            st.session_state.chat_history = []
+            # Oldest Q&A pair is dropped once 12 messages are stored
+            st.session_state.chat_history = deque(maxlen=12)
         if "message_count" not in st.session_state:
             st.session_state.message_count = 0
 
@@ -62,68 +69,72 @@ class HomePage(Page):
             return False
         return True
 
-    def _format_raw_response(self, raw_response: dict[str, Any]) -> dict[str, Any]:
+    def _extract_sources(self, source_docs: list[Document]) -> list[str]:
         """
-        Format RAG chain response maintaining exact structure from ollama.py
+        Extract unique source URLs from document metadata
 
         Args:
-            raw_response: Raw response from the RAG chain
+            source_docs: Source documents returned by the RAG chain
 
         Returns:
-            dict: Formatted response with answer and sources
+            list[str]: Source URLs in retrieval order
         """
-        try:
-            # Extract from result structure as defined in ollama.py
-            result = raw_response.get("result", {})
-            response = result.get("response", "")
-            source_docs = result.get("source_documents", [])
-
-            # Extract unique source URLs from metadata
-            sources = []
-            for doc in source_docs:
-                if hasattr(doc, "metadata"):
-                    source_url = doc.metadata.get("source_url")
-                    if source_url and source_url not in sources:
-                        sources.append(source_url)
-                        logger.debug(f"Source URL extracted: {source_url}")
-
-            return {
-                "answer": (
-                    response.content if hasattr(response, "content") else str(response)
-                ),
-                "sources": sources,
-            }
-
-        except Exception as e:
-            logger.error(f"Response formatting error: {e}", exc_info=True)
-            return {"answer": str(raw_response), "sources": []}
-
-    def _format_display_response(self, response: dict[str, Any]) -> str:
-        """Format response for display with clickable documentation links"""
-        try:
-            answer = response.get("answer", "")
-            sources = response.get("sources", [])
-
-            logger.debug(f"Formatting response with sources: {sources}")
+        sources = []
+        seen: set[str] = set()
+        for doc in source_docs:
+            if hasattr(doc, "metadata"):
+                source_url = doc.metadata.get("source_url")
+                if source_url and source_url not in seen:
+                    seen.add(source_url)
+                    sources.append(source_url)
+        logger.debug("Source URLs extracted: %s", sources)
+        return sources
+
+    def _stream_answer(
+        self,
+        chain: Runnable,
+        prompt: str,
+        source_docs: list[Document],
+        placeholder: DeltaGenerator,
+    ) -> str:
+        """
+        Stream the answer from the RAG chain into the chat message
 
-            # Format the answer first
-            formatted = f"{answer}\n\n"
+        Args:
+            chain: RAG chain as built by create_chain
+            prompt: User question
+            source_docs: List receiving the source documents of the answer
+            placeholder: Single element updated in place with the answer
 
-            # Add sources if available as clickable links
-            if sources:
-                formatted += "\n**Sources consultées:**\n"
-                for url in sources:
-                    if url:
-                        # Use the full URL directly
-                        formatted += f"- [Documentation]({url})\n"
-                        logger.debug(f"Added source link: {url}")
+        Returns:
+            str: Complete answer text
+        """
+        tokens: list[str] = []
+
+        # Use same input structure as in ollama.py
+        for chunk in chain.stream(
+            {
+                "question": prompt,
+                "session_id": st.session_state.session_id,
+                "chat_history": list(st.session_state.chat_history),
+            }
+        ):
+            result = chunk.get("result", {})
+            source_docs.extend(result.get("source_documents", []))
+            response = result.get("response")
+            if response:
+                tokens.append(
+                    response.content if hasattr(response, "content") else response
+                )
+                placeholder.markdown("".join(tokens))
 
-            logger.debug(f"Formatted response: {formatted}")
-            return formatted
+        return "".join(tokens)
 
-        except Exception as e:
-            logger.error(f"Error formatting display response: {e}", exc_info=True)
-            return str(response.get("answer", str(response)))
+    def _display_chat_history(self) -> None:
+        """Display previous messages of the session"""
+        for message in st.session_state.chat_history:
+            with st.chat_message(message["role"]):
+                st.markdown(message["content"])
 
     def _display_chat_interface(self) -> None:
         """Display chat interface using the same RAG chain as FastAPI"""
@@ -132,45 +143,34 @@ class HomePage(Page):
                 st.markdown(prompt)
 
             with st.chat_message("assistant"):
+                placeholder = st.empty()
                 try:
-                    with st.spinner("Processing..."):
-                        chain = get_rag_chain()
-                        if chain is None:
-                            raise ValueError("RAG chain initialization failed")
-
-                        # Use same input structure as in ollama.py
-                        raw_response = chain.invoke(
-                            {
-                                "question": prompt,
-                                "session_id": st.session_state.session_id,
-                                "chat_history": st.session_state.chat_history,
-                            }
-                        )
-
-                        formatted_response = self._format_raw_response(raw_response)
-
-                        # Format display with markdown as per RAG_SYSTEM_TEMPLATE
-                        display_text = formatted_response["answer"]
-                        if formatted_response["sources"]:
-                            display_text += "\n\n**Sources consultées:**"
-                            for url in formatted_response["sources"]:
-                                display_text += f"\n- [Documentation]({url})"
-
-                        # Maintain chat history limit (12 messages, 6 Q&A pairs)
-                        if len(st.session_state.chat_history) >= 12:
-                            # Remove oldest Q&A pair
-                            st.session_state.chat_history = (
-                                st.session_state.chat_history[2:]
-                            )
-
-                        st.session_state.chat_history.extend(
-                            [
-                                {"role": "user", "content": prompt},
-                                {"role": "assistant", "content": display_text},
-                            ]
-                        )
-
-                        st.markdown(display_text)
+                    chain = get_rag_chain()
+                    if chain is None:
+                        raise ValueError("RAG chain initialization failed")
+
+                    # Render tokens in place as they are generated
+                    source_docs: list[Document] = []
+                    display_text = self._stream_answer(
+                        chain, prompt, source_docs, placeholder
+                    )
+
+                    # Format sources with markdown as per RAG_SYSTEM_TEMPLATE
+                    sources = self._extract_sources(source_docs)
+                    if sources:
+                        sources_text = "**Sources consultées:**"
+                        for url in sources:
+                            sources_text += f"\n- [Documentation]({url})"
+                        display_text += "\n\n" + sources_text
+                        placeholder.markdown(display_text)
+
+                    # The bounded deque keeps the last 12 messages (6 Q&A pairs)
+                    st.session_state.chat_history.extend(
+                        [
+                            {"role": "user", "content": prompt},
+                            {"role": "assistant", "content": display_text},
+                        ]
+                    )
 
                 except Exception as e:
                     logger.error(f"Chat processing error: {e}", exc_info=True)
@@ -198,6 +198,7 @@ class HomePage(Page):
                 )
                 return st.container()
 
+            self._display_chat_history()
             self._display_chat_interface()
 
         # Right column for help and controls
@@ -206,6 +207,7 @@ class HomePage(Page):
                 app_state.conversation_manager.clear_conversation(
                     st.session_state.session_id
                 )
+                st.session_state.chat_history.clear()
                 st.rerun()
 
             with st.expander("Aide", expanded=False):
@@ -1,21 +1,28 @@
 """Admin interface for RAG system management"""
 
 import asyncio
-import time
-import zipfile
-from io import BytesIO
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
-import psutil
 from chromadb.api.models.Collection import Collection
+from langchain_chroma import Chroma
 
 import streamlit as st
 from rag_support_client.config.config import get_settings
-from rag_support_client.rag.document_loader import DocumentLoader
+from rag_support_client.rag.document_loader import (
+    corpus_fingerprint,
+    get_document_loader,
+    iter_markdown_entries,
+)
 from rag_support_client.rag.vectorstore.base import VectorStoreManager
 from rag_support_client.streamlit.components.base import Page
+from rag_support_client.streamlit.types import RagConfiguration
 from rag_support_client.utils.logger import logger
 from rag_support_client.utils.monitoring import (
     SystemStatus,
@@ -28,6 +35,172 @@ from rag_support_client.utils.monitoring import (
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
 
+@st.cache_resource(show_spinner=False)
+def _get_vectorstore() -> Chroma:
+    """
+    Open the persisted vectorstore once, shared across reruns and sessions.
+
+    Call _get_vectorstore.clear() after the collection is reset or rebuilt.
+
+    Returns:
+        Chroma: Vectorstore over the persisted collection
+    """
+    return VectorStoreManager.get_existing_vectorstore()
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def _format_bytes(size: int) -> str:
+    """Format bytes to human readable string."""
+    size = int(size)
+    # Each unit is 2**10 times the previous one
+    exponent = min(5, max(0, (size.bit_length() - 1) // 10))
+    return f"{size / (1 << (exponent * 10)):.1f} {_SIZE_UNITS[exponent]}"
+
+
+# Settings tab parameters grouped by category
+_SETTINGS_CATEGORIES = {
+    "LLM Settings": [
+        "OLLAMA_BASE_URL",
+        "OLLAMA_TIMEOUT",
+        "LLM_MODEL",
+        "EMBEDDING_MODEL",
+        "LLM_TEMPERATURE",
+        "LLM_NUM_CTX",
+        "LLM_TOP_K",
+        "LLM_TOP_P",
+    ],
+    "Text Processing": [
+        "CHUNK_SIZE",
+        "CHUNK_OVERLAP",
+        "SPLIT_METHOD",
+    ],
+    "Scoring Weights": [
+        "SIMILARITY_WEIGHT",
+        "RELEVANCE_WEIGHT",
+        "COVERAGE_WEIGHT",
+        "COHERENCE_WEIGHT",
+        "COMPLETENESS_WEIGHT",
+        "CONSISTENCY_WEIGHT",
+    ],
+    "Scoring Thresholds": [
+        "MIN_ACCEPTABLE_SCORE",
+        "EXCELLENT_SCORE",
+        "CONTRADICTION_PENALTY",
+        "QUESTION_KEYWORDS_WEIGHT",
+        "CONTEXT_MATCH_WEIGHT",
+    ],
+    "Answer Settings": [
+        "MIN_ANSWER_LENGTH",
+        "OPTIMAL_ANSWER_LENGTH",
+    ],
+}
+
+# Settings tab parameter descriptions, override the configuration ones
+_PARAM_DESCRIPTIONS = {
+    "SIMILARITY_WEIGHT": "Weight for semantic similarity between query and context",
+    "RELEVANCE_WEIGHT": "Weight for relevance of context to query",
+    "COVERAGE_WEIGHT": "Weight for how well context covers query topics",
+    "COHERENCE_WEIGHT": "Weight for logical flow and consistency",
+    "COMPLETENESS_WEIGHT": "Weight for answer completeness",
+    "CONSISTENCY_WEIGHT": "Weight for internal consistency",
+    "MIN_ACCEPTABLE_SCORE": "Minimum score threshold for valid responses",
+    "EXCELLENT_SCORE": "Score threshold for high-quality responses",
+    "CONTRADICTION_PENALTY": "Penalty factor for contradictory information",
+    "QUESTION_KEYWORDS_WEIGHT": "Weight for matching question keywords",
+    "CONTEXT_MATCH_WEIGHT": "Weight for context relevance matching",
+    "MIN_ANSWER_LENGTH": "Minimum acceptable answer length in characters",
+    "OPTIMAL_ANSWER_LENGTH": "Target answer length in characters",
+}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_configuration() -> RagConfiguration:
+    """Current RAG configuration, reused by reruns for a few minutes."""
+    return get_current_configuration()
+
+
+async def _check_health(
+    collection: Collection,
+) -> tuple[tuple[SystemStatus, str], tuple[SystemStatus, str, int | None]]:
+    """Check Ollama and ChromaDB health concurrently."""
+    return await asyncio.gather(
+        check_ollama_health(),
+        asyncio.to_thread(check_chromadb_health, collection),
+    )
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _collect_metrics() -> dict[str, Any]:
+    """
+    Collect system metrics, reused by reruns for a few seconds.
+
+    Call _collect_metrics.clear() to force a refresh.
+
+    Returns:
+        dict[str, Any]: Service statuses, process memory usage and embeddings
+        count, the count being None when ChromaDB is down
+    """
+    # Only the metrics need process information
+    import psutil
+
+    collection = cast(Collection, _get_vectorstore()._collection)
+    ollama_health, (chroma_status, chroma_msg, count) = asyncio.run(
+        _check_health(collection)
+    )
+    process = psutil.Process()
+    return {
+        "ollama_health": ollama_health,
+        "chroma_health": (chroma_status, chroma_msg),
+        "memory_rss": process.memory_info().rss,
+        "memory_percent": process.memory_percent(),
+        "embeddings_count": count,
+    }
+
+
+def _format_sizes(sizes: np.ndarray) -> pd.Series:
+    """Format an array of byte counts like _format_bytes, in one pass."""
+    if sizes.size == 0:
+        # An empty float Series can't be concatenated with the unit strings
+        return pd.Series([], dtype=str)
+    exponents = np.clip(np.log2(np.maximum(sizes, 1)) // 10, 0, 5).astype(np.int64)
+    values = pd.Series(sizes / np.power(1024.0, exponents))
+    return values.map("{:.1f}".format) + " " + np.array(_SIZE_UNITS)[exponents]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _scan_docs(raw_dir_str: str) -> pd.DataFrame:
+    """
+    List the Markdown documents of the raw directory.
+
+    Cached for a few seconds so reruns do not walk and stat the directory
+    again. Call _scan_docs.clear() after changing the documents.
+
+    Args:
+        raw_dir_str: Raw documents directory
+
+    Returns:
+        pd.DataFrame: File name, formatted size, modification date and
+        relative path of each document
+    """
+    entries = list(iter_markdown_entries(Path(raw_dir_str)))
+    stats = [entry.stat() for entry in entries]
+    sizes = np.fromiter((s.st_size for s in stats), dtype=np.int64, count=len(stats))
+    mtimes = np.fromiter(
+        (s.st_mtime for s in stats), dtype=np.float64, count=len(stats)
+    )
+
+    return pd.DataFrame(
+        {
+            "File": [entry.name for entry in entries],
+            "Size": _format_sizes(sizes),
+            "Last Modified": pd.to_datetime(mtimes, unit="s"),
+            "Path": [os.path.relpath(entry.path, raw_dir_str) for entry in entries],
+        }
+    )
+
+
 class AdminPage(Page):
     """Admin page component with improved state management."""
 
@@ -46,7 +219,6 @@ class AdminPage(Page):
             "metrics_update_interval": 30,
             "show_system_metrics": True,
             "config_changed": False,
-            "last_metrics_update": 0,
             "last_status_check": None,
             "system_status": None,
             "settings_values": {},
@@ -60,21 +232,10 @@ class AdminPage(Page):
             if key not in st.session_state:
                 st.session_state[key] = value
 
-    def _format_bytes(self, size: float) -> str:
-        """Format bytes to human readable string."""
-        size_float = float(size)  # Convert to float for division
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_float < 1024.0:
-                return f"{size_float:.1f} {unit}"
-            size_float /= 1024.0
-        return f"{size_float:.1f} PB"
-
     def _get_collection(self) -> Collection:
         """Get ChromaDB collection with error handling."""
         try:
-            manager = VectorStoreManager()
-            vectorstore = manager.get_existing_vectorstore()
-            return cast(Collection, vectorstore._collection)
+            return cast(Collection, _get_vectorstore()._collection)
         except Exception as e:
             logger.error(f"Failed to get ChromaDB collection: {e}")
             st.error("Failed to connect to ChromaDB")
@@ -97,30 +258,30 @@ class AdminPage(Page):
 
             # Confirmation
             if st.button("✔️ Confirm Reset", key="confirm_reset"):
-                # Get initial count for reporting
                 collection = self._get_collection()
-                initial_count = collection.count()
 
                 # Perform reset
                 with st.spinner("Resetting vectorstore..."):
                     if st.session_state.reset_mode == "complete":
-                        # Delete all documents
+                        # Delete all documents, other files in RAW_DIR are kept
                         raw_dir = Path(get_settings().RAW_DIR)
-                        for file in raw_dir.glob("**/*.md"):
-                            file.unlink()
-                            logger.info(f"Deleted document: {file}")
+                        deleted = 0
+                        for entry in iter_markdown_entries(raw_dir):
+                            Path(entry.path).unlink(missing_ok=True)
+                            deleted += 1
+                        logger.info(f"Deleted {deleted} documents from {raw_dir}")
+                        _scan_docs.clear()
 
                     # Reset ChromaDB
                     success, message = reset_chromadb(collection)
 
                     if success:
-                        st.success(
-                            f"Reset successful: {message}\n"
-                            f"Previous state: {initial_count:,} embeddings"
-                        )
+                        # The message reports the number of deleted embeddings
+                        st.success(f"Reset successful: {message}")
 
-                        # Force metrics update
-                        st.session_state.last_metrics_update = 0
+                        # Reopen the collection and force metrics update
+                        _get_vectorstore.clear()
+                        _collect_metrics.clear()
                         st.session_state.documents_loaded = False
                         st.session_state.vectorstore_initialized = False
 
@@ -138,20 +299,28 @@ class AdminPage(Page):
         """Reload vectorstore with progress tracking."""
         try:
             with st.spinner("Reloading vectorstore..."):
-                # Load documents
-                loader = DocumentLoader()
+                # Load documents, the current index is kept if none load
+                loader = get_document_loader()
                 documents = loader.load_documents()
+                if not documents:
+                    st.warning("No documents loaded, vectorstore left unchanged")
+                    return
 
                 # Count source documents
-                raw_docs = list(Path(get_settings().RAW_DIR).glob("**/*.md"))
-                raw_count = len(raw_docs)
+                raw_count = sum(
+                    1 for _ in iter_markdown_entries(Path(get_settings().RAW_DIR))
+                )
 
                 # Create progress bar
                 progress_text = "Processing documents..."
                 progress_bar = st.progress(0, text=progress_text)
 
-                # Create vectorstore with chunks
-                vectorstore = VectorStoreManager().create_vectorstore(documents)
+                # Replace the collection and record the corpus it was built from
+                vectorstore = VectorStoreManager.load_or_create(
+                    lambda: documents,
+                    rebuild=True,
+                    fingerprint=corpus_fingerprint(Path(get_settings().MARKDOWN_DIR)),
+                )
                 chunks_count = vectorstore._collection.count()
 
                 # Update progress
@@ -167,8 +336,9 @@ class AdminPage(Page):
                 st.session_state.documents_loaded = True
                 st.session_state.vectorstore_initialized = True
 
-                # Force metrics update
-                st.session_state.last_metrics_update = 0
+                # Reopen the rebuilt collection and force metrics update
+                _get_vectorstore.clear()
+                _collect_metrics.clear()
 
                 logger.info(
                     f"Vectorstore reloaded: {raw_count} docs, {chunks_count} chunks"
@@ -178,6 +348,18 @@ class AdminPage(Page):
             st.error(f"Failed to reload vectorstore: {e}")
             logger.error(f"Vectorstore reload error: {e}")
 
+    def _save_uploaded_file(self, raw_dir: Path, file: UploadedFile) -> bool:
+        """Save one uploaded file to the raw directory, False on failure."""
+        try:
+            # Stream from the upload buffer instead of copying it with getvalue()
+            file.seek(0)
+            with (raw_dir / file.name).open("wb") as dst:
+                shutil.copyfileobj(file, dst, length=1 << 20)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save {file.name}: {e}")
+            return False
+
     def _handle_document_upload(self, uploaded_files: list[UploadedFile]) -> None:
         """Handle document upload with progress tracking."""
         if not uploaded_files:
@@ -194,26 +376,31 @@ class AdminPage(Page):
             processed = 0
             failed = 0
 
-            for idx, file in enumerate(uploaded_files):
-                try:
-                    # Save file
-                    save_path = raw_dir / file.name
-                    save_path.write_bytes(file.getvalue())
-                    processed += 1
+            # Save files concurrently, progress follows completion order
+            with ThreadPoolExecutor(max_workers=min(16, total_files)) as executor:
+                futures = {
+                    executor.submit(self._save_uploaded_file, raw_dir, file): file
+                    for file in uploaded_files
+                }
+                for idx, future in enumerate(as_completed(futures)):
+                    if future.result():
+                        processed += 1
+                    else:
+                        failed += 1
 
                     # Update progress
                     progress = (idx + 1) / total_files
                     progress_bar.progress(
                         progress,
-                        text=f"Processing {file.name}... ({processed}/{total_files})",
+                        text=(
+                            f"Processing {futures[future].name}... "
+                            f"({processed}/{total_files})"
+                        ),
                     )
 
-                except Exception as e:
-                    failed += 1
-                    logger.error(f"Failed to save {file.name}: {e}")
-
             # Show results
             if processed > 0:
+                _scan_docs.clear()
                 st.success(f"Successfully processed {processed} files")
                 if st.button("Reload Vectorstore", key="reload_after_upload"):
                     self._reload_vectorstore()
@@ -230,76 +417,20 @@ class AdminPage(Page):
         st.subheader("RAG Configuration")
 
         try:
-            config = get_current_configuration()
-
-            # Group parameters by category
-            categories = {
-                "LLM Settings": [
-                    "OLLAMA_BASE_URL",
-                    "OLLAMA_TIMEOUT",
-                    "LLM_MODEL",
-                    "EMBEDDING_MODEL",
-                    "LLM_TEMPERATURE",
-                    "LLM_NUM_CTX",
-                    "LLM_TOP_K",
-                    "LLM_TOP_P",
-                ],
-                "Text Processing": [
-                    "CHUNK_SIZE",
-                    "CHUNK_OVERLAP",
-                    "SPLIT_METHOD",
-                ],
-                "Scoring Weights": [
-                    "SIMILARITY_WEIGHT",
-                    "RELEVANCE_WEIGHT",
-                    "COVERAGE_WEIGHT",
-                    "COHERENCE_WEIGHT",
-                    "COMPLETENESS_WEIGHT",
-                    "CONSISTENCY_WEIGHT",
-                ],
-                "Scoring Thresholds": [
-                    "MIN_ACCEPTABLE_SCORE",
-                    "EXCELLENT_SCORE",
-                    "CONTRADICTION_PENALTY",
-                    "QUESTION_KEYWORDS_WEIGHT",
-                    "CONTEXT_MATCH_WEIGHT",
-                ],
-                "Answer Settings": [
-                    "MIN_ANSWER_LENGTH",
-                    "OPTIMAL_ANSWER_LENGTH",
-                ],
-            }
-
-            # Parameter descriptions
-            param_descriptions = {
-                "SIMILARITY_WEIGHT": "Weight for semantic similarity "
-                "between query and context",
-                "RELEVANCE_WEIGHT": "Weight for relevance of context to query",
-                "COVERAGE_WEIGHT": "Weight for how well context covers query topics",
-                "COHERENCE_WEIGHT": "Weight for logical flow and consistency",
-                "COMPLETENESS_WEIGHT": "Weight for answer completeness",
-                "CONSISTENCY_WEIGHT": "Weight for internal consistency",
-                "MIN_ACCEPTABLE_SCORE": "Minimum score threshold for valid responses",
-                "EXCELLENT_SCORE": "Score threshold for high-quality responses",
-                "CONTRADICTION_PENALTY": "Penalty factor for contradictory information",
-                "QUESTION_KEYWORDS_WEIGHT": "Weight for matching question keywords",
-                "CONTEXT_MATCH_WEIGHT": "Weight for context relevance matching",
-                "MIN_ANSWER_LENGTH": "Minimum acceptable answer length in characters",
-                "OPTIMAL_ANSWER_LENGTH": "Target answer length in characters",
-            }
+            config = _cached_configuration()
 
             # Create tabs for each category
-            tabs = st.tabs(list(categories.keys()))
+            tabs = st.tabs(list(_SETTINGS_CATEGORIES))
 
             for tab, (category, param_names) in zip(
-                tabs, categories.items(), strict=True
+                tabs, _SETTINGS_CATEGORIES.items(), strict=True
             ):
                 with tab:
                     # Filter parameters for this category
                     category_params = {
-                        param.name: param
-                        for param in config.parameters.values()
-                        if param.name in param_names
+                        name: config.parameters[name]
+                        for name in param_names
+                        if name in config.parameters
                     }
 
                     if not category_params:
@@ -315,7 +446,7 @@ class AdminPage(Page):
                             st.code(str(param.value), language="python")
 
                         # Use custom description if available
-                        description = param_descriptions.get(
+                        description = _PARAM_DESCRIPTIONS.get(
                             param_name, param.description
                         )
                         st.markdown(f"_{description}_")
@@ -335,74 +466,45 @@ class AdminPage(Page):
             logger.error(f"Configuration load error: {e}")
 
     def _display_metrics_tab(self) -> None:
-        """Display system metrics with auto-refresh."""
+        """Display system metrics, refreshed at most every few seconds."""
         st.subheader("System Metrics")
 
-        # Initialize session state if needed
-        if "last_metrics_update" not in st.session_state:
-            st.session_state.last_metrics_update = 0
-        if "metrics" not in st.session_state:
-            st.session_state.metrics = None
-
         # Simple refresh button
         if st.button("🔄 Refresh Now", key="refresh_metrics", type="primary"):
-            st.session_state.last_metrics_update = 0
+            _collect_metrics.clear()
 
         try:
-            # Always update if refresh clicked or no metrics yet
-            if (
-                st.session_state.last_metrics_update == 0
-                or "metrics" not in st.session_state
-            ):
-                with st.spinner("Updating metrics..."):
-                    collection = self._get_collection()
-
-                    # Get system status
-                    ollama_status, ollama_msg = asyncio.run(check_ollama_health())
-                    chroma_status, chroma_msg = check_chromadb_health(collection)
-
-                    # Display status indicators
-                    status_col1, status_col2 = st.columns(2)
-                    with status_col1:
-                        status_icon = (
-                            "🟢" if ollama_status == SystemStatus.HEALTHY else "🔴"
-                        )
-                        st.markdown(f"**Ollama Status**: {status_icon} {ollama_msg}")
-                    with status_col2:
-                        status_icon = (
-                            "🟢" if chroma_status == SystemStatus.HEALTHY else "🔴"
-                        )
-                        st.markdown(f"**ChromaDB Status**: {status_icon} {chroma_msg}")
-
-                    # Get memory usage
-                    process = psutil.Process()
-                    memory_info = process.memory_info()
-                    memory_percent = process.memory_percent()
-
-                    # Display memory metrics
-                    st.subheader("Memory Usage")
-                    memory_text = (
-                        f"Memory: {memory_info.rss / 1024 / 1024:.1f}MB "
-                        f"({memory_percent:.1f}%)"
-                    )
-                    st.progress(
-                        memory_percent / 100,
-                        text=memory_text,
-                    )
+            with st.spinner("Updating metrics..."):
+                metrics = _collect_metrics()
+
+            # Display status indicators
+            ollama_status, ollama_msg = metrics["ollama_health"]
+            chroma_status, chroma_msg = metrics["chroma_health"]
+            status_col1, status_col2 = st.columns(2)
+            with status_col1:
+                status_icon = "🟢" if ollama_status == SystemStatus.HEALTHY else "🔴"
+                st.markdown(f"**Ollama Status**: {status_icon} {ollama_msg}")
+            with status_col2:
+                status_icon = "🟢" if chroma_status == SystemStatus.HEALTHY else "🔴"
+                st.markdown(f"**ChromaDB Status**: {status_icon} {chroma_msg}")
+
+            # Display memory metrics
+            memory_percent = metrics["memory_percent"]
+            st.subheader("Memory Usage")
+            memory_text = (
+                f"Memory: {metrics['memory_rss'] / 1024 / 1024:.1f}MB "
+                f"({memory_percent:.1f}%)"
+            )
+            st.progress(
+                memory_percent / 100,
+                text=memory_text,
+            )
 
-                    # Collection stats
-                    st.subheader("Collection Statistics")
-                    count = collection.count()
-                    st.markdown(f"Total embeddings: **{count:,}**")
-
-                    # Update timestamp and store metrics
-                    st.session_state.last_metrics_update = time.time()
-                    st.session_state.metrics = {
-                        "ollama_status": ollama_status,
-                        "chroma_status": chroma_status,
-                        "memory_percent": memory_percent,
-                        "embeddings_count": count,
-                    }
+            # Collection stats
+            st.subheader("Collection Statistics")
+            count = metrics["embeddings_count"]
+            if count is not None:
+                st.markdown(f"Total embeddings: **{count:,}**")
 
         except Exception as e:
             st.error(f"Failed to update metrics: {e}")
@@ -425,7 +527,7 @@ class AdminPage(Page):
             files_df = [
                 {
                     "Filename": file.name,
-                    "Size": self._format_bytes(file.size),
+                    "Size": _format_bytes(file.size),
                     "Status": "Pending",
                 }
                 for file in uploaded_files
@@ -441,28 +543,17 @@ class AdminPage(Page):
 
         # Existing documents section
         st.subheader("Existing Documents")
-        raw_dir = Path(get_settings().RAW_DIR)
-        files = list(raw_dir.glob("**/*.md"))
+        docs_df = _scan_docs(str(get_settings().RAW_DIR))
 
-        if not files:
+        if docs_df.empty:
             st.info("No documents found in the system.")
             return
 
-        # Prepare document data
-        docs_data = [
-            {
-                "File": file_path.name,
-                "Size": self._format_bytes(file_path.stat().st_size),
-                "Last Modified": pd.to_datetime(file_path.stat().st_mtime, unit="s"),
-                "Path": str(file_path.relative_to(raw_dir)),
-            }
-            for file_path in files
-        ]
-
         # Display documents table
         st.dataframe(
-            pd.DataFrame(docs_data),
+            docs_df,
             use_container_width=True,
+            hide_index=True,
             column_config={
                 "File": st.column_config.TextColumn(
                     "File",
@@ -495,7 +586,7 @@ class AdminPage(Page):
 
         with col2:
             if st.button("📥 Export Documents", key="export_docs"):
-                self._export_documents(docs_data)
+                self._export_documents(docs_df.to_dict("records"))
 
         with col3:
             if st.button(
@@ -511,27 +602,38 @@ class AdminPage(Page):
         Args:
             docs_data: List of document metadata dictionaries
         """
+        # Only needed when exporting, which few page loads do
+        import zipfile
+
         try:
-            # Create zip file in memory
-            zip_buffer = BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                raw_dir = Path(get_settings().RAW_DIR)
-                for doc in docs_data:
-                    file_path = raw_dir / doc["Path"]
-                    if file_path.exists():
-                        zip_file.write(file_path, doc["Path"])
-
-            # Offer download
-            zip_data = zip_buffer.getvalue()
-            if len(zip_data) > 0:
-                st.download_button(  # type: ignore
-                    label="Download Documents",
-                    data=zip_data,
-                    file_name="documents.zip",
-                    mime="application/zip",
-                )
-            else:
-                st.warning("No documents to export")
+            # Store files uncompressed in a temporary file rather than
+            # deflating them into an in-memory buffer
+            with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as zip_tmp:
+                zip_path = Path(zip_tmp.name)
+
+            try:
+                exported = 0
+                with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zip_file:
+                    raw_dir = Path(get_settings().RAW_DIR)
+                    for doc in docs_data:
+                        file_path = raw_dir / doc["Path"]
+                        if file_path.exists():
+                            zip_file.write(file_path, doc["Path"])
+                            exported += 1
+
+                # Offer download from a read-only handle on the archive
+                if exported > 0:
+                    with zip_path.open("rb") as archive:
+                        st.download_button(  # type: ignore
+                            label="Download Documents",
+                            data=archive,
+                            file_name="documents.zip",
+                            mime="application/zip",
+                        )
+                else:
+                    st.warning("No documents to export")
+            finally:
+                zip_path.unlink(missing_ok=True)
 
         except Exception as e:
             st.error(f"Failed to export documents: {e}")
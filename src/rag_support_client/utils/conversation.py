@@ -18,10 +18,15 @@ Returns:
 
 import time
 import uuid
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from threading import Lock, Thread
 
+# Number of independently locked session shards
+_SHARDS = 32
+
 
 @dataclass
 class Message:
@@ -29,7 +34,12 @@ class Message:
 
     role: str  # "human" or "assistant"
     content: str
-    timestamp: datetime = datetime.now()
+    created_at: float = field(default_factory=time.time)  # seconds since epoch
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time of the message"""
+        return datetime.fromtimestamp(self.created_at)
 
     def to_dict(self) -> dict:
         """Converts message to dict format for LangChain memory"""
@@ -37,6 +47,16 @@ class Message:
         return {"role": role_mapping.get(self.role, self.role), "content": self.content}
 
 
+@dataclass
+class _SessionShard:
+    """Sessions hashed to the same shard, guarded by one lock"""
+
+    conversations: dict[str, deque[Message]] = field(default_factory=dict)
+    # Least recently active session first
+    last_activity: OrderedDict[str, float] = field(default_factory=OrderedDict)
+    lock: Lock = field(default_factory=Lock)
+
+
 class ConversationManager:
     """Thread-safe conversation manager with memory retention and automated cleanup"""
 
@@ -46,12 +66,11 @@ class ConversationManager:
         session_timeout: int = 3600,
         cleanup_interval: int = 300,
     ) -> None:
-        self._conversations: dict[str, list[Message]] = {}
-        self._last_activity: dict[str, datetime] = {}
-        self._session_locks: dict[str, Lock] = {}
+        # Sessions are spread over shards so unrelated sessions never wait
+        # on each other's lock
+        self._shards = [_SessionShard() for _ in range(_SHARDS)]
         self.max_history = max_history
         self.session_timeout = session_timeout  # seconds
-        self._master_lock = Lock()
         self._cleanup_interval = cleanup_interval
         self._cleanup_thread: Thread | None = None
         self._running = True
@@ -74,82 +93,93 @@ class ConversationManager:
         self._running = False
         if self._cleanup_thread:
             self._cleanup_thread.join(timeout=1.0)
-        with self._master_lock:
-            self._conversations.clear()
-            self._last_activity.clear()
-            self._session_locks.clear()
-
-    def _get_session_lock(self, session_id: str) -> Lock:
-        """Gets or creates a lock for a specific session"""
-        with self._master_lock:
-            if session_id not in self._session_locks:
-                self._session_locks[session_id] = Lock()
-            return self._session_locks[session_id]
+        for shard in self._shards:
+            with shard.lock:
+                shard.conversations.clear()
+                shard.last_activity.clear()
+
+    def _get_shard(self, session_id: str) -> _SessionShard:
+        """Gets the shard holding a specific session"""
+        return self._shards[hash(session_id) % _SHARDS]
 
     def _cleanup_expired_sessions(self) -> None:
         """Removes expired sessions based on timeout"""
-        current_time = datetime.now()
-        with self._master_lock:
-            expired_sessions = [
-                session_id
-                for session_id, last_activity in self._last_activity.items()
-                if (current_time - last_activity).total_seconds() > self.session_timeout
-            ]
-
-            for session_id in expired_sessions:
-                session_lock = self._session_locks.get(session_id)
-                if session_lock:
-                    with session_lock:
-                        self._conversations.pop(session_id, None)
-                        self._last_activity.pop(session_id, None)
-                        self._session_locks.pop(session_id, None)
+        current_time = time.monotonic()
+        for shard in self._shards:
+            with shard.lock:
+                # Only the expired sessions at the front are visited
+                last_activity = shard.last_activity
+                while last_activity:
+                    session_id, activity = next(iter(last_activity.items()))
+                    if current_time - activity <= self.session_timeout:
+                        break
+                    last_activity.popitem(last=False)
+                    shard.conversations.pop(session_id, None)
 
     def add_message(self, session_id: str, role: str, content: str) -> None:
         """Adds message to conversation with automatic history trimming"""
-        session_lock = self._get_session_lock(session_id)
-        with session_lock:
-            if session_id not in self._conversations:
-                self._conversations[session_id] = []
-
-            message = Message(role=role, content=content)
-            self._conversations[session_id].append(message)
-            self._last_activity[session_id] = datetime.now()
-
-            if len(self._conversations[session_id]) > self.max_history:
-                self._conversations[session_id] = self._conversations[session_id][
-                    -self.max_history :
-                ]
+        shard = self._get_shard(session_id)
+        message = Message(role=role, content=content)
+        with shard.lock:
+            conversation = shard.conversations.get(session_id)
+            if conversation is None:
+                # Appending past max_history drops the oldest message
+                conversation = deque(maxlen=self.max_history)
+                shard.conversations[session_id] = conversation
+
+            conversation.append(message)
+            shard.last_activity[session_id] = time.monotonic()
+            shard.last_activity.move_to_end(session_id)
 
     def get_history(self, session_id: str) -> list[dict]:
         """Returns conversation history in LangChain-compatible format"""
-        session_lock = self._get_session_lock(session_id)
-        with session_lock:
-            messages = self._conversations.get(session_id, [])
-            return [msg.to_dict() for msg in messages]
+        shard = self._get_shard(session_id)
+        # Only snapshot under the lock, messages are never mutated once added
+        with shard.lock:
+            messages = tuple(shard.conversations.get(session_id, ()))
+        return [msg.to_dict() for msg in messages]
+
+    def get_recent(self, session_id: str, n: int = 12) -> list[dict]:
+        """Returns the last n messages in LangChain-compatible format"""
+        shard = self._get_shard(session_id)
+        with shard.lock:
+            conversation = shard.conversations.get(session_id, ())
+            messages = tuple(islice(conversation, max(0, len(conversation) - n), None))
+        return [msg.to_dict() for msg in messages]
+
+    def history_length(self, session_id: str) -> int:
+        """Returns number of messages stored for session without copying them"""
+        shard = self._get_shard(session_id)
+        with shard.lock:
+            return len(shard.conversations.get(session_id, ()))
 
     def clear_conversation(self, session_id: str) -> None:
         """Removes conversation history for given session"""
-        session_lock = self._get_session_lock(session_id)
-        with session_lock:
-            self._conversations.pop(session_id, None)
-            self._last_activity.pop(session_id, None)
-            self._session_locks.pop(session_id, None)
+        shard = self._get_shard(session_id)
+        with shard.lock:
+            shard.conversations.pop(session_id, None)
+            shard.last_activity.pop(session_id, None)
 
     def get_active_sessions(self) -> list[str]:
         """Returns list of active session IDs"""
-        with self._master_lock:
-            self._cleanup_expired_sessions()
-            return list(self._conversations.keys())
+        self._cleanup_expired_sessions()
+        sessions: list[str] = []
+        for shard in self._shards:
+            with shard.lock:
+                sessions.extend(shard.conversations)
+        return sessions
 
     def get_session_time_remaining(self, session_id: str) -> int | None:
         """Returns remaining time in seconds for session or None if expired"""
-        with self._master_lock:
-            if session_id not in self._last_activity:
-                return None
+        shard = self._get_shard(session_id)
+        with shard.lock:
+            last_activity = shard.last_activity.get(session_id)
+        if last_activity is None:
+            return None
 
-            elapsed = (datetime.now() - self._last_activity[session_id]).total_seconds()
-            remaining = self.session_timeout - elapsed
-            return max(0, int(remaining))
+        elapsed = time.monotonic() - last_activity
+        remaining = self.session_timeout - elapsed
+        return max(0, int(remaining))
 
     @staticmethod
     def create_session_id() -> str:
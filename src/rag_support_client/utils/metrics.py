@@ -1,17 +1,21 @@
 """Metrics collection and monitoring for RAG system"""
 
 import time
-from collections.abc import Awaitable, Callable
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
+from threading import Lock
 from typing import Any, TypeVar, cast
 
 import httpx
+import numpy as np
 import psutil
 from chromadb.api.models.Collection import Collection
 
 from rag_support_client.config.config import get_settings
+from rag_support_client.rag.document_loader import iter_markdown_entries
 from rag_support_client.streamlit.types import (
     ChromaDBStatus,
     DocumentStats,
@@ -29,11 +33,94 @@ settings = get_settings()
 T = TypeVar("T")
 P = TypeVar("P")
 
-# Global metrics storage
-_request_times: list[float] = []
-_requests_last_minute: list[float] = []
-_ollama_latencies: list[float] = []
-_last_errors: list[str] = []
+
+def _ttl_cache(
+    seconds: float, key: Callable[..., Hashable] | None = None
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Memoize a function's results for a limited time.
+
+    Args:
+        seconds: How long a result is reused, measured with time.monotonic()
+        key: Builds the cache key from the call arguments, defaults to the
+            positional arguments themselves
+
+    Returns:
+        Callable: Decorator applying the cache
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        cache: dict[Hashable, tuple[T, float]] = {}
+        lock = Lock()
+
+        @wraps(func)
+        def wrapper(*args: Any) -> T:
+            cache_key = key(*args) if key else args
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(cache_key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+            value = func(*args)
+            with lock:
+                cache[cache_key] = (value, now + seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+class _RollingWindow:
+    """Fixed-capacity ring buffer of timestamped samples in NumPy arrays"""
+
+    def __init__(self, capacity: int) -> None:
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self._lock = Lock()
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Store a sample, overwriting the oldest one once full"""
+        with self._lock:
+            self._times[self._head] = timestamp
+            self._values[self._head] = value
+            self._head = (self._head + 1) % len(self._values)
+            self._size = min(self._size + 1, len(self._values))
+
+    def _since(self, cutoff: float) -> np.ndarray:
+        """Values of the samples recorded after cutoff"""
+        with self._lock:
+            size = self._size
+            return self._values[:size][self._times[:size] > cutoff]
+
+    def count_since(self, cutoff: float) -> int:
+        """Number of samples recorded after cutoff"""
+        return int(self._since(cutoff).size)
+
+    def mean_since(self, cutoff: float) -> float:
+        """Mean of the samples recorded after cutoff, 0.0 if there are none"""
+        values = self._since(cutoff)
+        return float(values.mean()) if values.size else 0.0
+
+
+# Global metrics storage, bounded ring buffers of timestamped samples
+_request_times = _RollingWindow(10000)
+_ollama_latencies = _RollingWindow(10000)
+_error_times = _RollingWindow(10000)
+# Latest error messages with the time they were recorded at
+_last_errors: deque[tuple[float, str]] = deque(maxlen=100)
+
+
+def _record_request(duration: float, error: Exception | None = None) -> None:
+    """Record a measured request and its error, if any"""
+    now = time.time()
+    _request_times.append(now, duration)
+    if error is not None:
+        _error_times.append(now, 1.0)
+        _last_errors.append((now, f"{datetime.fromtimestamp(now)}: {str(error)}"))
 
 
 def measure_time(func: Callable[..., T]) -> Callable[..., T]:
@@ -44,15 +131,10 @@ def measure_time(func: Callable[..., T]) -> Callable[..., T]:
         start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            duration = time.perf_counter() - start_time
-            _request_times.append(duration)
-            _requests_last_minute.append(time.time())
+            _record_request(time.perf_counter() - start_time)
             return result
         except Exception as e:
-            duration = time.perf_counter() - start_time
-            _request_times.append(duration)
-            _requests_last_minute.append(time.time())
-            _last_errors.append(f"{datetime.now()}: {str(e)}")
+            _record_request(time.perf_counter() - start_time, e)
             raise
 
     return wrapper
@@ -68,37 +150,15 @@ def measure_time_async(
         start_time = time.perf_counter()
         try:
             result = await func(*args, **kwargs)
-            duration = time.perf_counter() - start_time
-            _request_times.append(duration)
-            _requests_last_minute.append(time.time())
+            _record_request(time.perf_counter() - start_time)
             return result
         except Exception as e:
-            duration = time.perf_counter() - start_time
-            _request_times.append(duration)
-            _requests_last_minute.append(time.time())
-            _last_errors.append(f"{datetime.now()}: {str(e)}")
+            _record_request(time.perf_counter() - start_time, e)
             raise
 
     return wrapper
 
 
-def _clean_old_metrics() -> None:
-    """Clean up metrics older than 1 hour"""
-    current_time = time.time()
-    cutoff_time = current_time - 3600  # 1 hour ago
-
-    # Clean request times
-    global _request_times, _requests_last_minute, _ollama_latencies, _last_errors
-    _request_times = [t for t in _request_times if t > cutoff_time]
-    _requests_last_minute = [
-        t for t in _requests_last_minute if t > (current_time - 60)
-    ]
-    _ollama_latencies = [t for t in _ollama_latencies if t > cutoff_time]
-
-    # Keep only last hour of errors
-    _last_errors = _last_errors[-100:]  # Keep last 100 errors maximum
-
-
 async def check_ollama_status() -> OllamaStatus:
     """Check Ollama service status and latency"""
     try:
@@ -107,7 +167,7 @@ async def check_ollama_status() -> OllamaStatus:
             response = await client.get(f"{settings.OLLAMA_BASE_URL}/api/tags")
             latency = (time.perf_counter() - start_time) * 1000  # Convert to ms
 
-            _ollama_latencies.append(latency)
+            _ollama_latencies.append(time.time(), latency)
 
             if response.status_code == 200:
                 models = response.json()
@@ -181,26 +241,24 @@ def get_chromadb_status(collection: Collection) -> ChromaDBStatus:
 
 def calculate_rag_metrics() -> RagMetrics:
     """Calculate current RAG system metrics"""
-    _clean_old_metrics()
+    current_time = time.time()
+    cutoff_time = current_time - 3600  # 1 hour ago
 
     # Calculate average response time
-    avg_response_time = (
-        sum(_request_times) / len(_request_times) if _request_times else 0.0
-    )
+    avg_response_time = _request_times.mean_since(cutoff_time)
 
     # Calculate requests per minute
-    requests_per_minute = len(_requests_last_minute)
+    requests_per_minute = _request_times.count_since(current_time - 60)
 
     # Calculate average Ollama latency
-    avg_ollama_latency = (
-        sum(_ollama_latencies) / len(_ollama_latencies) if _ollama_latencies else 0.0
-    )
+    avg_ollama_latency = _ollama_latencies.mean_since(cutoff_time)
 
-    # Calculate success rate
-    total_requests = len(_request_times)
-    error_count = len(_last_errors)
+    # Calculate success rate over the same hour, kept within 0-100 should
+    # the error window outlive request samples overwritten under heavy load
+    total_requests = _request_times.count_since(cutoff_time)
+    error_count = _error_times.count_since(cutoff_time)
     success_rate = (
-        ((total_requests - error_count) / total_requests) * 100
+        min(100.0, max(0.0, (total_requests - error_count) / total_requests * 100))
         if total_requests > 0
         else 100.0
     )
@@ -214,32 +272,46 @@ def calculate_rag_metrics() -> RagMetrics:
     )
 
 
+@_ttl_cache(seconds=10)
+def _count_documents(raw_dir: Path) -> int:
+    """Count Markdown documents, reused for a few seconds"""
+    return sum(1 for _ in iter_markdown_entries(raw_dir))
+
+
+@_ttl_cache(seconds=10, key=lambda collection: collection.id)
+def _average_chunk_size(collection: Collection) -> float:
+    """Average size of a sample of stored chunks, reused for a few seconds"""
+    avg_chunk_size = float(settings.CHUNK_SIZE)  # default value
+    try:
+        # Get a sample of chunks to calculate average size
+        sample = collection.get(limit=100)
+        if sample and isinstance(sample, dict) and "documents" in sample:
+            docs = cast(list[str], sample["documents"])
+            if docs:
+                total_chars = sum(len(doc) for doc in docs)
+                avg_chunk_size = float(total_chars / len(docs))
+    except Exception as e:
+        logger.warning(f"Failed to calculate average chunk size: {e}")
+    return avg_chunk_size
+
+
 async def get_system_metrics(collection: Collection) -> SystemMetrics:
     """Get complete system metrics"""
     ollama_status = await check_ollama_status()
     chromadb_status = get_chromadb_status(collection)
     rag_metrics = calculate_rag_metrics()
+    cutoff_time = time.time() - 3600  # 1 hour ago
 
     # Count actual documents (before chunking)
-    raw_docs_path = Path(settings.RAW_DIR)
-    total_documents = len(list(raw_docs_path.glob("**/*.md")))
+    total_documents = _count_documents(Path(settings.RAW_DIR))
 
-    # Get chunks count from ChromaDB
-    total_chunks = collection.count()
+    # Reuse the chunks count of the ChromaDB status
+    total_chunks = chromadb_status.total_embeddings
 
     # Calculate average chunk size if there are chunks
     avg_chunk_size = float(settings.CHUNK_SIZE)  # default value
     if total_chunks > 0:
-        try:
-            # Get a sample of chunks to calculate average size
-            sample = collection.get(limit=min(total_chunks, 100))
-            if sample and isinstance(sample, dict) and "documents" in sample:
-                docs = cast(list[str], sample["documents"])
-                if docs:
-                    total_chars = sum(len(doc) for doc in docs)
-                    avg_chunk_size = float(total_chars / len(docs))
-        except Exception as e:
-            logger.warning(f"Failed to calculate average chunk size: {e}")
+        avg_chunk_size = _average_chunk_size(collection)
 
     # Create document stats
     docs_stats = DocumentStats(
@@ -255,6 +327,8 @@ async def get_system_metrics(collection: Collection) -> SystemMetrics:
         chromadb=chromadb_status,
         rag_metrics=rag_metrics,
         docs_stats=docs_stats,
-        errors_last_hour=_last_errors[-10:],  # Return last 10 errors
+        errors_last_hour=[
+            message for recorded, message in _last_errors if recorded > cutoff_time
+        ][-10:],  # Return last 10 errors
         timestamp=datetime.now(),
     )
@@ -384,8 +384,16 @@ async def check_ollama_health() -> tuple[SystemStatus, str]:
         return SystemStatus.DOWN, f"Ollama service error: {str(e)}"
 
 
-def check_chromadb_health(collection: Collection) -> tuple[SystemStatus, str]:
-    """Check ChromaDB health status with detailed metrics."""
+def check_chromadb_health(
+    collection: Collection,
+) -> tuple[SystemStatus, str, int | None]:
+    """
+    Check ChromaDB health status with detailed metrics.
+
+    Returns:
+        tuple[SystemStatus, str, int | None]: Status, details and embeddings
+        count, None when the collection could not be queried
+    """
     try:
         count = collection.count()
         process = psutil.Process()
@@ -402,21 +410,24 @@ def check_chromadb_health(collection: Collection) -> tuple[SystemStatus, str]:
             return (
                 SystemStatus.DEGRADED,
                 f"ChromaDB high memory usage: {status_details}",
+                count,
             )
 
         if count == 0:
             return (
                 SystemStatus.DEGRADED,
                 f"ChromaDB empty: {status_details}",
+                count,
             )
 
         return (
             SystemStatus.HEALTHY,
             f"ChromaDB healthy: {status_details}",
+            count,
         )
     except Exception as e:
         logger.error(f"ChromaDB health check failed: {e}")
-        return SystemStatus.DOWN, f"ChromaDB error: {str(e)}"
+        return SystemStatus.DOWN, f"ChromaDB error: {str(e)}", None
 
 
 def reset_chromadb(collection: Collection) -> tuple[bool, str]:
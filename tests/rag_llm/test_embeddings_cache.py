@@ -0,0 +1,90 @@
+"""
+Test embeddings cache module.
+
+This module verifies that cached embeddings only reach the underlying model
+for texts that were not embedded before.
+
+Returns:
+    None: These tests verify embeddings cache behavior
+"""
+
+from langchain_core.embeddings import Embeddings
+
+from rag_support_client.rag.embeddings.cache import CachedEmbeddings
+
+
+class CountingEmbeddings(Embeddings):
+    """Fake embeddings model recording the texts it receives."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append([text])
+        return [-float(len(text))]
+
+
+def test_embed_documents_reuses_cached_vectors() -> None:
+    """
+    Test that duplicate and previously seen texts are not embedded again.
+
+    Returns:
+        None: Verifies only unseen texts reach the model, in input order
+    """
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, maxsize=10)
+
+    assert cached.embed_documents(["a", "bb", "a"]) == [[1.0], [2.0], [1.0]]
+    assert cached.embed_documents(["bb", "ccc"]) == [[2.0], [3.0]]
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+
+
+def test_embed_query_is_cached_separately() -> None:
+    """
+    Test that query vectors are cached apart from document vectors.
+
+    Returns:
+        None: Verifies queries use the model's query embedding once
+    """
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, maxsize=10)
+
+    cached.embed_documents(["a"])
+    assert cached.embed_query("a") == [-1.0]
+    assert cached.embed_query("a") == [-1.0]
+    assert inner.calls == [["a"], ["a"]]
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """
+    Test that the cache never holds more than maxsize vectors.
+
+    Returns:
+        None: Verifies the oldest entry is embedded again after eviction
+    """
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, maxsize=2)
+
+    cached.embed_documents(["a", "bb"])
+    cached.embed_documents(["ccc"])
+    cached.embed_documents(["a"])
+    assert inner.calls == [["a", "bb"], ["ccc"], ["a"]]
+
+
+def test_uncached_texts_are_sent_in_batches() -> None:
+    """
+    Test that uncached texts are split into batches of batch_size.
+
+    Returns:
+        None: Verifies batch requests and that vectors keep the input order
+    """
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, maxsize=10, batch_size=2, concurrency=2)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    assert cached.embed_documents(texts) == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(inner.calls) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
@@ -0,0 +1,262 @@
+"""
+Test vector store reuse module.
+
+This module verifies that the persisted vector store is only rebuilt when
+the Markdown corpus fingerprint changes or a rebuild is requested.
+
+Returns:
+    None: These tests verify corpus fingerprint and index reuse behavior
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from langchain.schema import Document
+from langchain_core.embeddings import Embeddings
+
+from rag_support_client.config.config import get_settings
+from rag_support_client.rag import document_loader
+from rag_support_client.rag.document_loader import corpus_fingerprint
+from rag_support_client.rag.vectorstore import base
+from rag_support_client.rag.vectorstore.base import VectorStoreManager
+
+COLLECTION = "fingerprint_test"
+
+
+class ConstantEmbeddings(Embeddings):
+    """Fake embeddings model returning a fixed vector for every text."""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[1.0, 0.0, 0.0] for _ in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [1.0, 0.0, 0.0]
+
+
+class CountingLoader:
+    """Document loader callable recording how often it is invoked."""
+
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+        self.calls = 0
+
+    def __call__(self) -> list[Document]:
+        self.calls += 1
+        return [
+            Document(page_content=text, metadata={"source": f"doc{i}.md"})
+            for i, text in enumerate(self.texts)
+        ]
+
+
+@pytest.fixture(autouse=True)
+def stub_embeddings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Replace the Ollama embeddings model with a local stub.
+
+    Returns:
+        None: Patches get_embeddings for the duration of a test
+    """
+    monkeypatch.setattr(base, "get_embeddings", ConstantEmbeddings)
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    """
+    Create a small Markdown corpus.
+
+    Args:
+        tmp_path: Pytest temporary directory
+
+    Returns:
+        Path: Root directory of the corpus
+    """
+    docs_dir = tmp_path / "docs"
+    (docs_dir / "nested").mkdir(parents=True)
+    (docs_dir / "intro.md").write_text("# Intro\n\nHello\n", encoding="utf-8")
+    (docs_dir / "nested" / "guide.md").write_text(
+        "# Guide\n\nSteps\n", encoding="utf-8"
+    )
+    return docs_dir
+
+
+def _load(
+    persist_dir: Path,
+    loader: CountingLoader,
+    fingerprint: str | None = None,
+    rebuild: bool = False,
+) -> int:
+    """Run load_or_create and return the resulting embeddings count."""
+    vectorstore = VectorStoreManager.load_or_create(
+        loader,
+        persist_directory=persist_dir,
+        collection_name=COLLECTION,
+        rebuild=rebuild,
+        fingerprint=fingerprint,
+    )
+    return vectorstore._collection.count()
+
+
+def test_fingerprint_is_stable_for_unchanged_corpus(corpus: Path) -> None:
+    """
+    Test that fingerprinting ignores non-Markdown files and is repeatable.
+
+    Returns:
+        None: Verifies identical corpora produce identical fingerprints
+    """
+    fingerprint = corpus_fingerprint(corpus)
+    (corpus / "notes.txt").write_text("not indexed", encoding="utf-8")
+
+    assert corpus_fingerprint(corpus) == fingerprint
+
+
+def test_fingerprint_tracks_corpus_changes(corpus: Path) -> None:
+    """
+    Test that size, modification time and file set changes are detected.
+
+    Returns:
+        None: Verifies each kind of change yields a new fingerprint
+    """
+    seen = {corpus_fingerprint(corpus)}
+    intro = corpus / "intro.md"
+
+    stat = intro.stat()
+    os.utime(intro, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    seen.add(corpus_fingerprint(corpus))
+
+    intro.write_text("# Intro\n\nHello again\n", encoding="utf-8")
+    seen.add(corpus_fingerprint(corpus))
+
+    (corpus / "extra.md").write_text("# Extra\n", encoding="utf-8")
+    seen.add(corpus_fingerprint(corpus))
+
+    (corpus / "nested" / "guide.md").unlink()
+    seen.add(corpus_fingerprint(corpus))
+
+    assert len(seen) == 5
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"CHUNK_SIZE": 512},
+        {"CHUNK_OVERLAP": 10},
+        {"SEPARATORS": '["\\n\\n", "\\n"]'},
+        {"EMBEDDING_MODEL": "other-embed"},
+    ],
+)
+def test_fingerprint_tracks_index_settings(
+    corpus: Path, monkeypatch: pytest.MonkeyPatch, update: dict[str, object]
+) -> None:
+    """
+    Test that chunking and embedding settings are part of the fingerprint.
+
+    Returns:
+        None: Verifies an unchanged corpus indexed differently is rebuilt
+    """
+    fingerprint = corpus_fingerprint(corpus)
+    changed = get_settings().model_copy(update=update)
+    monkeypatch.setattr(document_loader, "get_settings", lambda: changed)
+
+    assert corpus_fingerprint(corpus) != fingerprint
+
+
+def test_unchanged_corpus_reuses_index(tmp_path: Path, corpus: Path) -> None:
+    """
+    Test that a matching fingerprint skips document loading.
+
+    Returns:
+        None: Verifies documents are embedded once and the index is reused
+    """
+    persist_dir = tmp_path / "chroma"
+    loader = CountingLoader(["first", "second"])
+    fingerprint = corpus_fingerprint(corpus)
+
+    assert _load(persist_dir, loader, fingerprint=fingerprint) == 2
+    assert (persist_dir / f"{COLLECTION}.fingerprint").read_text() == fingerprint
+
+    assert _load(persist_dir, loader, fingerprint=corpus_fingerprint(corpus)) == 2
+    assert loader.calls == 1
+
+
+def test_changed_corpus_rebuilds_index(tmp_path: Path, corpus: Path) -> None:
+    """
+    Test that a different fingerprint drops and re-embeds the collection.
+
+    Returns:
+        None: Verifies the index only holds the documents of the new build
+    """
+    persist_dir = tmp_path / "chroma"
+    _load(persist_dir, CountingLoader(["a", "b"]), corpus_fingerprint(corpus))
+
+    (corpus / "intro.md").write_text("# Intro\n\nUpdated\n", encoding="utf-8")
+    fingerprint = corpus_fingerprint(corpus)
+    loader = CountingLoader(["a", "b", "c"])
+
+    assert _load(persist_dir, loader, fingerprint=fingerprint) == 3
+    assert loader.calls == 1
+    assert (persist_dir / f"{COLLECTION}.fingerprint").read_text() == fingerprint
+
+
+def test_index_without_fingerprint_is_adopted(tmp_path: Path, corpus: Path) -> None:
+    """
+    Test that an index built before fingerprints existed is kept.
+
+    Returns:
+        None: Verifies the index is reused and its fingerprint recorded
+    """
+    persist_dir = tmp_path / "chroma"
+    _load(persist_dir, CountingLoader(["a", "b"]))
+    fingerprint_file = persist_dir / f"{COLLECTION}.fingerprint"
+    assert not fingerprint_file.exists()
+
+    loader = CountingLoader(["a", "b", "c"])
+    fingerprint = corpus_fingerprint(corpus)
+
+    assert _load(persist_dir, loader, fingerprint=fingerprint) == 2
+    assert loader.calls == 0
+    assert fingerprint_file.read_text() == fingerprint
+
+
+def test_rebuild_flag_forces_rebuild(tmp_path: Path, corpus: Path) -> None:
+    """
+    Test that rebuild=True re-embeds even when the corpus is unchanged.
+
+    Returns:
+        None: Verifies documents are loaded again for an explicit rebuild
+    """
+    persist_dir = tmp_path / "chroma"
+    fingerprint = corpus_fingerprint(corpus)
+    _load(persist_dir, CountingLoader(["a", "b"]), fingerprint=fingerprint)
+
+    loader = CountingLoader(["a"])
+
+    assert _load(persist_dir, loader, fingerprint=fingerprint, rebuild=True) == 1
+    assert loader.calls == 1
+
+
+def test_failed_load_keeps_index(tmp_path: Path, corpus: Path) -> None:
+    """
+    Test that a loader failure during a rebuild leaves the index in place.
+
+    Returns:
+        None: Verifies the collection and fingerprint survive the failure
+    """
+    persist_dir = tmp_path / "chroma"
+    fingerprint = corpus_fingerprint(corpus)
+    _load(persist_dir, CountingLoader(["a", "b"]), fingerprint=fingerprint)
+
+    def failing_loader() -> list[Document]:
+        raise RuntimeError("No documents loaded")
+
+    with pytest.raises(RuntimeError):
+        VectorStoreManager.load_or_create(
+            failing_loader,
+            persist_directory=persist_dir,
+            collection_name=COLLECTION,
+            rebuild=True,
+            fingerprint=fingerprint,
+        )
+
+    assert _load(persist_dir, CountingLoader([]), fingerprint=fingerprint) == 2
+    assert (persist_dir / f"{COLLECTION}.fingerprint").read_text() == fingerprint
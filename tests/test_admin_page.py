@@ -0,0 +1,66 @@
+"""
+Test admin page helpers module.
+
+This module verifies the size formatting helpers used by the documents
+table of the Streamlit admin page.
+
+Returns:
+    None: These tests verify admin page helper behavior
+"""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+import pytest
+
+ADMIN_PAGE = (
+    Path(__file__).parents[1]
+    / "src"
+    / "rag_support_client"
+    / "streamlit"
+    / "pages"
+    / "3_⚙️_Admin.py"
+)
+
+
+@pytest.fixture(scope="module")
+def admin_page() -> ModuleType:
+    """
+    Load the admin page module from its file path.
+
+    Returns:
+        ModuleType: The imported admin page module
+    """
+    spec = importlib.util.spec_from_file_location("admin_page", ADMIN_PAGE)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_format_sizes_matches_format_bytes(admin_page: ModuleType) -> None:
+    """
+    Test that the vectorized formatter agrees with the scalar one.
+
+    Returns:
+        None: Verifies each formatted size equals _format_bytes output
+    """
+    sizes = np.array([0, 1, 1023, 1024, 1536, 5 * 2**20, 3 * 2**30], dtype=np.int64)
+
+    formatted = admin_page._format_sizes(sizes)
+
+    assert formatted.tolist() == [admin_page._format_bytes(size) for size in sizes]
+
+
+def test_format_sizes_handles_no_files(admin_page: ModuleType) -> None:
+    """
+    Test that an empty documents directory formats to an empty column.
+
+    Returns:
+        None: Verifies no error is raised and the result is empty
+    """
+    formatted = admin_page._format_sizes(np.array([], dtype=np.int64))
+
+    assert formatted.empty
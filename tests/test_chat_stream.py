@@ -0,0 +1,188 @@
+"""
+Test chat streaming endpoint module.
+
+This module verifies the Server-Sent Events emitted by the streaming chat
+endpoint, using a stub RAG chain in place of Ollama and ChromaDB.
+
+Returns:
+    None: These tests verify streaming chat endpoint behavior
+"""
+
+from collections.abc import AsyncIterator, Generator
+from typing import Any
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from langchain.schema import Document
+from langchain_core.runnables import AddableDict
+
+from rag_support_client.api.dependencies import get_api_key
+from rag_support_client.api.routers import chat
+from rag_support_client.utils.conversation import ConversationManager
+from rag_support_client.utils.state import app_state
+
+SESSION_ID = "test-session"
+QUESTION = "Comment configurer mon terminal ?"
+
+
+class StubChain:
+    """RAG chain stand-in streaming preset chunks, optionally failing after."""
+
+    def __init__(
+        self, chunks: list[dict[str, Any]], error: Exception | None = None
+    ) -> None:
+        self.chunks = chunks
+        self.error = error
+        self.inputs: list[dict[str, Any]] = []
+
+    async def astream(self, inputs: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        self.inputs.append(inputs)
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+def _answer_chunks(documents: list[Document], tokens: list[str]) -> list[dict]:
+    """Chunks as streamed by create_chain: sources first, then each token."""
+    return [{"result": AddableDict(response="", source_documents=documents)}] + [
+        {"result": AddableDict(response=token)} for token in tokens
+    ]
+
+
+def _parse_events(body: bytes) -> list[tuple[str, dict[str, Any]]]:
+    """Split a text/event-stream body into (event, JSON data) pairs."""
+    events = []
+    for frame in body.split(b"\n\n"):
+        if not frame:
+            continue
+        event_line, data_line = frame.split(b"\n")
+        assert event_line.startswith(b"event: ")
+        assert data_line.startswith(b"data: ")
+        event = event_line.removeprefix(b"event: ").decode()
+        events.append((event, orjson.loads(data_line.removeprefix(b"data: "))))
+    return events
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient, None, None]:
+    """
+    Provide a client for the chat router with a fresh conversation manager.
+
+    Returns:
+        Generator[TestClient, None, None]: Client skipping API key checks
+    """
+    manager = ConversationManager()
+    monkeypatch.setattr(app_state, "conversation_manager", manager)
+
+    app = FastAPI()
+    app.include_router(chat.router)
+    app.dependency_overrides[get_api_key] = lambda: "test-key"
+
+    with TestClient(app) as test_client:
+        yield test_client
+    manager.stop()
+
+
+def _stream(client: TestClient) -> Any:
+    """Post the test question to the streaming endpoint."""
+    return client.post(
+        f"/chat/{SESSION_ID}/stream",
+        json={"question": QUESTION, "include_confidence": False},
+    )
+
+
+def test_stream_emits_tokens_then_done(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that tokens are streamed before a final done event.
+
+    Returns:
+        None: Verifies SSE framing, the done payload and stored history
+    """
+    documents = [
+        Document(
+            page_content="Étapes",
+            metadata={"h1": "Terminal", "source_url": "https://doc/terminal"},
+        ),
+        Document(
+            page_content="Suite",
+            metadata={"h1": "Autre", "source_url": "https://doc/terminal"},
+        ),
+    ]
+    chain = StubChain(_answer_chunks(documents, ["Ouvrez ", "les ", "paramètres"]))
+    monkeypatch.setattr(app_state, "rag_chain", chain)
+
+    response = _stream(client)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+
+    events = _parse_events(response.content)
+    assert events[:-1] == [
+        ("token", {"token": "Ouvrez "}),
+        ("token", {"token": "les "}),
+        ("token", {"token": "paramètres"}),
+    ]
+
+    event, payload = events[-1]
+    assert event == "done"
+    assert payload["answer"] == {
+        "title": "Terminal",
+        "content": "Ouvrez les paramètres",
+        "format": "markdown",
+    }
+    assert payload["sources"] == ["https://doc/terminal"]
+    assert payload["metadata"]["session_id"] == SESSION_ID
+    assert payload["metadata"]["question"] == QUESTION
+    assert payload["metadata"]["context_length"] == 2
+    assert "confidence" not in payload
+
+    assert chain.inputs == [{"question": QUESTION, "session_id": SESSION_ID}]
+    assert app_state.conversation_manager.get_history(SESSION_ID) == [
+        {"role": "user", "content": QUESTION},
+        {"role": "assistant", "content": "Ouvrez les paramètres"},
+    ]
+
+
+def test_stream_reports_errors_as_event(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that a failure during generation ends the stream with an error event.
+
+    Returns:
+        None: Verifies the error event and that nothing is stored
+    """
+    chain = StubChain(_answer_chunks([], ["Partiel"]), error=RuntimeError("boom"))
+    monkeypatch.setattr(app_state, "rag_chain", chain)
+
+    response = _stream(client)
+
+    assert response.status_code == 200
+    events = _parse_events(response.content)
+    assert events[0] == ("token", {"token": "Partiel"})
+    assert events[-1][0] == "error"
+    assert "boom" in events[-1][1]["detail"]
+    assert all(event != "done" for event, _ in events)
+    assert app_state.conversation_manager.history_length(SESSION_ID) == 0
+
+
+def test_stream_requires_initialized_chain(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that streaming is refused before the RAG chain is ready.
+
+    Returns:
+        None: Verifies a 503 response is returned without streaming
+    """
+    monkeypatch.setattr(app_state, "rag_chain", None)
+
+    response = _stream(client)
+
+    assert response.status_code == 503
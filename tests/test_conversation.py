@@ -0,0 +1,144 @@
+"""
+Test conversation management module.
+
+This module verifies history trimming, recent message lookups and session
+expiry of the ConversationManager.
+
+Returns:
+    None: These tests verify conversation manager behavior
+"""
+
+import time
+from collections.abc import Generator
+from types import SimpleNamespace
+
+import pytest
+
+from rag_support_client.utils import conversation
+from rag_support_client.utils.conversation import ConversationManager
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """
+    Drive the conversation module's monotonic clock from the test.
+
+    Returns:
+        FakeClock: Clock whose ``now`` attribute sets the current time
+    """
+    fake = FakeClock()
+    fake_time = SimpleNamespace(monotonic=fake, sleep=time.sleep, time=time.time)
+    monkeypatch.setattr(conversation, "time", fake_time)
+    return fake
+
+
+@pytest.fixture
+def manager(clock: FakeClock) -> Generator[ConversationManager, None, None]:
+    """
+    Provide a manager with a short timeout and no periodic cleanup pass.
+
+    Returns:
+        Generator[ConversationManager, None, None]: Manager stopped afterwards
+    """
+    conversation_manager = ConversationManager(
+        max_history=3, session_timeout=100, cleanup_interval=3600
+    )
+    yield conversation_manager
+    conversation_manager.stop()
+
+
+def test_history_keeps_latest_messages(manager: ConversationManager) -> None:
+    """
+    Test that history is trimmed to max_history, oldest messages first.
+
+    Returns:
+        None: Verifies only the last max_history messages remain
+    """
+    for i in range(5):
+        manager.add_message("session", "human" if i % 2 else "assistant", f"m{i}")
+
+    assert manager.history_length("session") == 3
+    assert manager.get_history("session") == [
+        {"role": "assistant", "content": "m2"},
+        {"role": "user", "content": "m3"},
+        {"role": "assistant", "content": "m4"},
+    ]
+
+
+def test_get_recent_returns_last_messages(manager: ConversationManager) -> None:
+    """
+    Test that get_recent returns the newest messages in order.
+
+    Returns:
+        None: Verifies slicing for small, zero and oversized counts
+    """
+    for content in ("a", "b", "c"):
+        manager.add_message("session", "human", content)
+
+    assert [m["content"] for m in manager.get_recent("session", 2)] == ["b", "c"]
+    assert manager.get_recent("session", 0) == []
+    assert [m["content"] for m in manager.get_recent("session", 10)] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert manager.get_recent("unknown", 2) == []
+
+
+def test_activity_refresh_delays_expiry(
+    monkeypatch: pytest.MonkeyPatch, clock: FakeClock
+) -> None:
+    """
+    Test that a session active again is not expired with older sessions.
+
+    Every session shares one shard so the cleanup relies on the activity
+    order within that shard.
+
+    Returns:
+        None: Verifies only sessions idle past the timeout are removed
+    """
+    monkeypatch.setattr(conversation, "_SHARDS", 1)
+    manager = ConversationManager(session_timeout=100, cleanup_interval=3600)
+    try:
+        manager.add_message("first", "human", "hello")
+        clock.now += 10
+        manager.add_message("second", "human", "hello")
+        clock.now += 10
+        manager.add_message("first", "human", "again")
+
+        clock.now += 95
+        assert manager.get_active_sessions() == ["first"]
+        assert manager.get_session_time_remaining("first") == 5
+        assert manager.get_session_time_remaining("second") is None
+
+        clock.now += 10
+        assert manager.get_active_sessions() == []
+        assert manager.history_length("first") == 0
+    finally:
+        manager.stop()
+
+
+def test_clear_conversation_removes_session(manager: ConversationManager) -> None:
+    """
+    Test that clearing a session drops its history and activity.
+
+    Returns:
+        None: Verifies the session is no longer listed or timed
+    """
+    manager.add_message("session", "human", "hello")
+
+    manager.clear_conversation("session")
+
+    assert manager.get_history("session") == []
+    assert manager.get_session_time_remaining("session") is None
+    assert "session" not in manager.get_active_sessions()
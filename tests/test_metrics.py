@@ -0,0 +1,112 @@
+"""
+Test metrics collection module.
+
+This module verifies the ring buffer holding the timestamped request and
+latency samples, and the success rate computed from them.
+
+Returns:
+    None: These tests verify rolling window and RAG metrics behavior
+"""
+
+import time
+
+import pytest
+
+from rag_support_client.utils import metrics
+from rag_support_client.utils.metrics import _RollingWindow, calculate_rag_metrics
+
+
+def test_empty_window_has_no_samples() -> None:
+    """
+    Test that a new window reports no samples.
+
+    Returns:
+        None: Verifies zero count and a 0.0 mean
+    """
+    window = _RollingWindow(3)
+
+    assert window.count_since(0.0) == 0
+    assert window.mean_since(0.0) == 0.0
+
+
+def test_window_overwrites_oldest_samples() -> None:
+    """
+    Test that appending past capacity wraps around over the oldest samples.
+
+    Returns:
+        None: Verifies only the last capacity samples are kept
+    """
+    window = _RollingWindow(3)
+    for timestamp, value in ((1.0, 10.0), (2.0, 20.0), (3.0, 30.0), (4.0, 40.0)):
+        window.append(timestamp, value)
+
+    assert window.count_since(0.0) == 3
+    assert window.mean_since(0.0) == 30.0
+
+    window.append(5.0, 50.0)
+    window.append(6.0, 60.0)
+
+    assert window.count_since(0.0) == 3
+    assert window.mean_since(0.0) == 50.0
+
+
+def test_window_cutoff_is_exclusive() -> None:
+    """
+    Test that only samples recorded strictly after the cutoff are used.
+
+    Returns:
+        None: Verifies counts and means for several cutoffs
+    """
+    window = _RollingWindow(4)
+    for timestamp, value in ((1.0, 1.0), (2.0, 2.0), (3.0, 6.0)):
+        window.append(timestamp, value)
+
+    assert window.count_since(1.0) == 2
+    assert window.mean_since(1.0) == 4.0
+    assert window.count_since(3.0) == 0
+    assert window.mean_since(3.0) == 0.0
+
+
+@pytest.fixture
+def empty_windows(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Replace the global sample windows with empty ones.
+
+    Returns:
+        None: Patches the metrics storage for the duration of a test
+    """
+    monkeypatch.setattr(metrics, "_request_times", _RollingWindow(100))
+    monkeypatch.setattr(metrics, "_ollama_latencies", _RollingWindow(100))
+    monkeypatch.setattr(metrics, "_error_times", _RollingWindow(100))
+
+
+def test_success_rate_ignores_old_errors(empty_windows: None) -> None:
+    """
+    Test that only errors of the last hour lower the success rate.
+
+    Returns:
+        None: Verifies old errors are not counted against recent requests
+    """
+    now = time.time()
+    for _ in range(5):
+        metrics._error_times.append(now - 7200, 1.0)
+    for _ in range(4):
+        metrics._request_times.append(now - 10, 0.5)
+    metrics._error_times.append(now - 10, 1.0)
+
+    assert calculate_rag_metrics().success_rate == 75.0
+
+
+def test_success_rate_stays_within_bounds(empty_windows: None) -> None:
+    """
+    Test that more recent errors than requests cannot go below zero.
+
+    Returns:
+        None: Verifies the success rate is clamped to 0
+    """
+    now = time.time()
+    metrics._request_times.append(now - 10, 0.5)
+    for _ in range(3):
+        metrics._error_times.append(now - 10, 1.0)
+
+    assert calculate_rag_metrics().success_rate == 0.0